@@ -4,19 +4,32 @@ AI Resume Analyzer — Streamlit Entry Point
 Run with:  streamlit run app.py
 """
 
+import io
+import uuid
+
 import streamlit as st
 
-from config.skills_db import SKILLS_DB
+from config.settings import SANDBOX_ENABLED
 from styles.theme import get_theme_css
-from utils.analyzer import (
-    extract_text,
-    preprocess_text,
-    extract_skills,
-    count_skill_frequencies,
-    calculate_strength_score,
-    recommend_role,
+from utils.archive import (
+    ArchiveError,
+    count_zip_members,
+    is_archive,
+    iter_zip_members,
+)
+from utils.batch import iter_batch, summarize_result
+from utils.charts import (
+    build_pie_chart,
+    build_bar_chart,
+    build_share_pie_chart,
+    build_histogram_chart,
+    build_trend_chart,
 )
-from utils.charts import build_pie_chart, build_bar_chart
+from utils.corpus import CorpusStats
+from utils.profiles import SkillIndex, skill_bitset, skill_gap
+from utils.roles import get_default_engine
+from utils.store import AnalysisStore
+from utils.workers import WarmPool
 
 
 # ---------------------------------------------------------------------------
@@ -34,8 +47,16 @@ def main() -> None:
     if "theme" not in st.session_state:
         st.session_state["theme"] = "dark"
 
-    # Right-aligned toggle row
-    _, toggle_col = st.columns([6, 1])
+    # View switch (left) + right-aligned toggle row
+    view_col, _, toggle_col = st.columns([2, 4, 1])
+    with view_col:
+        view = st.radio(
+            "View",
+            ["Analyzer", "Corpus"],
+            horizontal=True,
+            key="_view",
+            label_visibility="collapsed",
+        )
     with toggle_col:
         is_light = st.toggle(
             "☀️ Light",
@@ -47,6 +68,10 @@ def main() -> None:
 
     st.markdown(get_theme_css(theme), unsafe_allow_html=True)
 
+    if view == "Corpus":
+        _render_corpus(theme)
+        return
+
     # ---- Hero + Upload ----
     st.markdown(
         "<div class='hero'>"
@@ -58,65 +83,341 @@ def main() -> None:
 
     col_pad_l, col_upload, col_pad_r = st.columns([1, 2, 1])
     with col_upload:
-        uploaded_file = st.file_uploader(
-            "Upload your resume",
-            type=["pdf", "docx", "txt"],
-            help="Supported: PDF, DOCX, TXT",
+        folder_mode = st.toggle(
+            "📁 Upload a whole folder",
+            value=False,
+            key="_folder_mode",
+        )
+        uploaded_files = st.file_uploader(
+            "Upload your resumes",
+            type=["pdf", "docx", "txt", "zip"],
+            accept_multiple_files="directory" if folder_mode else True,
+            help="Supported: PDF, DOCX, TXT, or a ZIP of them — drop several at once",
             label_visibility="collapsed",
         )
 
     # ---- Guard: nothing uploaded yet ----
-    if uploaded_file is None:
+    if not uploaded_files:
         placeholder_color = "#555" if theme == "dark" else "#999"
         st.markdown(
             f"<p style='text-align:center; color:{placeholder_color}; margin-top:60px; "
             "font-size:0.95rem;'>"
-            "Upload a PDF, DOCX, or TXT resume to get started.</p>",
+            "Upload one or more PDF, DOCX, or TXT resumes to get started.</p>",
             unsafe_allow_html=True,
         )
         return
 
-    # ---- Process file (cached in session state) ----
-    file_id = f"{uploaded_file.name}_{uploaded_file.size}"
-    if st.session_state.get("_file_id") != file_id:
-        with st.spinner("Analyzing…"):
-            try:
-                raw_text = extract_text(uploaded_file)
-            except Exception as exc:
-                st.error(f"Error reading file: {exc}")
-                return
-            if not raw_text.strip():
-                st.warning("No text could be extracted.")
-                return
-
-            cleaned = preprocess_text(raw_text)
-            detected = extract_skills(cleaned)
-            total_skills = sum(len(v) for v in detected.values())
-            score = calculate_strength_score(detected)
-            role_info = recommend_role(detected)
-            frequencies = count_skill_frequencies(cleaned, detected)
-
-            st.session_state.update(
-                {
-                    "_file_id": file_id,
-                    "raw_text": raw_text,
-                    "detected": detected,
-                    "total_skills": total_skills,
-                    "score": score,
-                    "role_info": role_info,
-                    "frequencies": frequencies,
-                    "file_name": uploaded_file.name,
-                }
+    # ---- Process new files concurrently ----
+    # The session keeps only compact refs (summary row + store handle); one
+    # entry per upload, and a ZIP upload maps to one ref per member.
+    results: dict[str, list[dict]] = st.session_state.setdefault("results", {})
+    store = _get_store()
+    uploads = {_upload_id(f): f for f in uploaded_files}
+    for stale in set(results) - set(uploads):
+        for ref in results.pop(stale):
+            if ref["handle"]:
+                store.discard(ref["handle"])
+
+    new_files = [f for file_id, f in uploads.items() if file_id not in results]
+    if new_files:
+        _process_uploads(new_files, results)
+
+    ordered = [r for file_id in uploads for r in results.get(file_id, [])]
+    if not ordered:
+        st.warning("No resumes found in the upload.")
+        return
+    if len(ordered) == 1:
+        ref = ordered[0]
+    else:
+        ref = _render_batch_summary(ordered)
+        if ref is None:
+            return
+
+    if ref["status"] == "error":
+        st.error(f"Error reading file: {ref['error']}")
+        return
+    if ref["status"] == "empty":
+        st.warning(ref["error"])
+        return
+
+    result = store.get(ref["handle"])
+    if result is None:
+        # Evicted from the shared store — re-analyze just this resume
+        result = _reanalyze(ref, uploads[ref["upload_id"]])
+        if result is None and ref["status"] != "ok":
+            st.error(f"Error reading file: {ref['error']}")
+            return
+        if result is None:
+            st.warning(
+                f"The analysis of {ref['file_name']} is no longer available. "
+                "Please upload it again."
+            )
+            return
+    _render_details(result, theme)
+
+
+# ---------------------------------------------------------------------------
+# Batch processing & summary
+# ---------------------------------------------------------------------------
+def _process_uploads(files: list, results: dict[str, list[dict]]) -> None:
+    """Analyze uploaded files through the shared pool with live progress."""
+    store = _get_store()
+    total = 0
+    # Collected locally and recorded only once the batch is done, so an
+    # interrupted run leaves these uploads pending and they are retried.
+    collected: dict[str, list[dict]] = {}
+    for f in files:
+        for old in results.pop(_upload_id(f), []):
+            if old["handle"]:
+                store.discard(old["handle"])
+        collected[_upload_id(f)] = []
+        total += _count_resumes(f)
+    total = max(total, 1)
+    corpus = _get_corpus()
+    skill_index = _get_skill_index()
+    owner = _session_owner()
+    progress = st.progress(0.0, text=f"Analyzing 0 / {total}…")
+    with st.status(f"Analyzing {total} resume(s)…", expanded=total > 1) as status:
+        items = ((_upload_id(f), f.name, f.getvalue()) for f in files)
+        for done, result in enumerate(_run_batch(items), start=1):
+            ok = result["status"] == "ok"
+            handle = store.put(result, owner) if ok else None
+            collected[result["source"]].append(_make_ref(result, handle))
+            corpus.update(result)
+            if ok:
+                skill_index.add(
+                    result["content_id"],
+                    skill_bitset(result["detected"]),
+                    label=result["file_name"],
+                )
+                status.write(f"✅ {result['file_name']} — {result['score']}%")
+            else:
+                status.write(f"⚠️ {result['file_name']} — {result['error']}")
+            progress.progress(
+                min(done / total, 1.0), text=f"Analyzing {done} / {total}…"
             )
+        status.update(label=f"Analyzed {total} resume(s)", state="complete",
+                      expanded=False)
+    progress.empty()
+    results.update(collected)
+
+
+def _run_batch(items):
+    """Analyze items through the sandbox or the shared worker pool."""
+    if SANDBOX_ENABLED:
+        # Parsers already run in the shared sandbox processes
+        return iter_batch(items, sandboxed=True)
+    return iter_batch(items, executor=_get_process_pool())
+
+
+def _make_ref(result: dict, handle: str | None) -> dict:
+    """Compact per-resume entry kept in session state."""
+    return {
+        "upload_id": result["source"],
+        "file_name": result["file_name"],
+        "status": result["status"],
+        "error": result["error"],
+        "summary": summarize_result(result),
+        "handle": handle,
+    }
+
+
+def _reanalyze(ref: dict, upload) -> dict | None:
+    """
+    Re-analyze one evicted resume, replacing its ref in place.
+
+    Only that resume is parsed again; for a ZIP upload just its member is
+    read. Returns the stored result, or None if it could not be recovered.
+    """
+    name, data = upload.name, upload.getvalue()
+    if is_archive(name):
+        member = ref["file_name"][len(name) + 1:]
+        try:
+            found = list(iter_zip_members(io.BytesIO(data), only=member))
+        except ArchiveError:
+            return None
+        if not found or isinstance(found[0][1], ArchiveError):
+            return None
+        data = found[0][1]
+    result = next(iter(_run_batch([(ref["upload_id"], ref["file_name"], data)])), None)
+    if result is None:
+        return None
+
+    store = _get_store()
+    handle = store.put(result, _session_owner()) if result["status"] == "ok" else None
+    ref.update(_make_ref(result, handle))
+    return store.get(handle) if handle else None
+
+
+def _session_owner() -> str:
+    return st.session_state.setdefault("_session_token", uuid.uuid4().hex)
+
+
+def _upload_id(uploaded_file) -> str:
+    return f"{uploaded_file.name}_{uploaded_file.size}"
+
+
+def _count_resumes(uploaded_file) -> int:
+    """Expected number of results for one upload (ZIPs report their members)."""
+    if not is_archive(uploaded_file.name):
+        return 1
+    try:
+        return count_zip_members(uploaded_file)
+    except ArchiveError:
+        return 1
+
+
+@st.cache_resource
+def _get_corpus() -> CorpusStats:
+    """Server-wide aggregates over every resume analyzed by any session."""
+    return CorpusStats()
+
+
+@st.cache_resource
+def _get_skill_index() -> SkillIndex:
+    """Server-wide bitset profiles of every analyzed resume."""
+    return SkillIndex()
+
+
+@st.cache_resource
+def _get_store() -> AnalysisStore:
+    """Server-wide LRU holding every session's analysis results."""
+    return AnalysisStore()
+
+
+@st.cache_resource
+def _get_process_pool() -> WarmPool:
+    """Server-wide pool of warm, pre-forked workers shared by every session."""
+    return WarmPool()
+
+
+def _render_batch_summary(refs: list[dict]) -> dict | None:
+    """Show a sortable summary table; return the ref of the selected row."""
+    st.markdown(
+        "<p class='sec-title'><span class='accent'>00</span> Batch Summary</p>",
+        unsafe_allow_html=True,
+    )
+    event = st.dataframe(
+        [ref["summary"] for ref in refs],
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key="_batch_table",
+        column_config={
+            "Score": st.column_config.ProgressColumn(
+                "Score", format="%.1f%%", min_value=0, max_value=100
+            ),
+        },
+    )
+    rows = event.selection.rows
+    # The selection survives reruns and can outlive rows removed from the upload
+    if not rows or rows[0] >= len(refs):
+        st.info("Select a row to open the detailed analysis.")
+        return None
+    return refs[rows[0]]
+
+
+# ---------------------------------------------------------------------------
+# Corpus dashboard
+# ---------------------------------------------------------------------------
+def _render_corpus(theme: str) -> None:
+    corpus = _get_corpus()
+    st.markdown(
+        "<div class='hero'>"
+        "<h1>Corpus Analytics</h1>"
+        "<p>Aggregates over every resume analyzed on this server.</p>"
+        "</div>",
+        unsafe_allow_html=True,
+    )
+    if not corpus.resumes:
+        st.info("No resumes analyzed yet — switch to Analyzer and upload some.")
+        return
+
+    st.markdown(
+        "<p class='sec-title'><span class='accent'>01</span> Overview</p>",
+        unsafe_allow_html=True,
+    )
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Resumes Analyzed", corpus.resumes)
+    c2.metric("Unique Resumes (≈)", corpus.distinct_resumes.estimate())
+    c3.metric("Mean Score", f"{corpus.mean_score()}%")
+    c4.metric("Distinct Terms (≈)", corpus.distinct_terms.estimate())
+
+    st.markdown(
+        "<p class='sec-title'><span class='accent'>02</span> Skills &amp; Domains</p>",
+        unsafe_allow_html=True,
+    )
+    left, right = st.columns(2)
+    with left:
+        st.plotly_chart(
+            build_bar_chart(
+                corpus.skill_counts, theme=theme, x_title="Resumes", unit="resume(s)"
+            ),
+            width="stretch",
+        )
+    with right:
+        st.plotly_chart(
+            build_share_pie_chart(corpus.domain_counts, theme=theme),
+            width="stretch",
+        )
+
+    st.markdown(
+        "<p class='sec-title'><span class='accent'>03</span> Scores &amp; Roles</p>",
+        unsafe_allow_html=True,
+    )
+    left, right = st.columns(2)
+    with left:
+        st.plotly_chart(
+            build_histogram_chart(
+                corpus.score_hist.edges, corpus.score_hist.counts, theme=theme
+            ),
+            width="stretch",
+        )
+    with right:
+        st.plotly_chart(
+            build_bar_chart(
+                corpus.role_counts, theme=theme, x_title="Resumes", unit="resume(s)"
+            ),
+            width="stretch",
+        )
 
-    # Unpack
-    detected = st.session_state["detected"]
-    total_skills = st.session_state["total_skills"]
-    score = st.session_state["score"]
-    role_info = st.session_state["role_info"]
-    frequencies = st.session_state["frequencies"]
-    raw_text = st.session_state["raw_text"]
-    file_name = st.session_state["file_name"]
+    st.markdown(
+        "<p class='sec-title'><span class='accent'>04</span> Weekly Trend</p>",
+        unsafe_allow_html=True,
+    )
+    st.plotly_chart(
+        build_trend_chart(*corpus.weekly_trend(), theme=theme),
+        width="stretch",
+    )
+
+    st.markdown(
+        "<p class='sec-title'><span class='accent'>05</span> Term Lookup</p>",
+        unsafe_allow_html=True,
+    )
+    term = st.text_input("Term", placeholder="e.g. fastapi", key="_corpus_term")
+    if term.strip():
+        count = corpus.term_sketch.estimate(term.strip().lower())
+        st.markdown(f"**{term.strip()}** appears in about **{count}** resume(s).")
+
+    stats = _get_store().stats()
+    st.caption(
+        f"Analysis store: {stats['bytes'] / 2**20:.1f} / "
+        f"{stats['max_bytes'] / 2**20:.0f} MB held across {stats['sessions']} "
+        f"session(s), {stats['entries']} result(s), {stats['evictions']} eviction(s)."
+    )
+
+
+# ---------------------------------------------------------------------------
+# Detailed analysis of one resume
+# ---------------------------------------------------------------------------
+def _render_details(result: dict, theme: str) -> None:
+    detected = result["detected"]
+    total_skills = result["total_skills"]
+    score = result["score"]
+    role_info = result["role_info"]
+    frequencies = result["frequencies"]
+    text_preview = result["text_preview"]
+    text_length = result["text_length"]
 
     # ==================================================================
     # 01 — Overview metrics
@@ -204,12 +505,18 @@ def main() -> None:
         "<p class='sec-title'><span class='accent'>05</span> Recommended Roles</p>",
         unsafe_allow_html=True,
     )
+    role_scores = dict(role_info.get("role_scores", []))
+    match = (
+        f"  ·  {role_scores[role_info['primary']]}% match"
+        if role_info["primary"] in role_scores
+        else ""
+    )
     st.markdown(
         f"<div class='role-card-primary'>"
         f"<p style='color:#777; margin:0 0 4px; font-size:0.75rem; "
         f"text-transform:uppercase; letter-spacing:1px;'>Primary Recommendation</p>"
         f"<h3>{role_info['primary']}</h3>"
-        f"<p>Based on: {role_info['dominant_domain']}</p>"
+        f"<p>Based on: {role_info['dominant_domain']}{match}</p>"
         f"</div>",
         unsafe_allow_html=True,
     )
@@ -217,8 +524,13 @@ def main() -> None:
         st.markdown("<br>", unsafe_allow_html=True)
         cols = st.columns(len(role_info["alternatives"]))
         for idx, alt in enumerate(role_info["alternatives"]):
+            alt_match = (
+                f"<br><small>{role_scores[alt]}% match</small>"
+                if alt in role_scores
+                else ""
+            )
             cols[idx].markdown(
-                f"<div class='role-card-alt'>{alt}</div>",
+                f"<div class='role-card-alt'>{alt}{alt_match}</div>",
                 unsafe_allow_html=True,
             )
 
@@ -256,7 +568,56 @@ def main() -> None:
         unsafe_allow_html=True,
     )
     with st.expander("Show resume text", expanded=False):
-        st.text(raw_text[:5000] + ("…" if len(raw_text) > 5000 else ""))
+        st.text(text_preview + ("…" if text_length > len(text_preview) else ""))
+
+    # ==================================================================
+    # 08 — Skill Gaps
+    # ==================================================================
+    st.markdown(
+        "<p class='sec-title'><span class='accent'>08</span> Missing Skills</p>",
+        unsafe_allow_html=True,
+    )
+    profile = skill_bitset(detected)
+    roles = get_default_engine().roles
+    target = st.selectbox(
+        "Target role",
+        roles,
+        index=roles.index(role_info["primary"]) if role_info["primary"] in roles else 0,
+        key=f"_gap_role_{result['content_id']}",
+    )
+    gap = skill_gap(profile, target)
+    st.caption(
+        f"Covers {len(gap['covered'])} of {gap['required']} key skills for {target}."
+    )
+    if gap["missing"]:
+        chips = "".join(f"<span class='skill-chip'>{s}</span>" for s in gap["missing"])
+        st.markdown(f"<div class='domain-block'>{chips}</div>", unsafe_allow_html=True)
+    else:
+        st.success(f"No key skills missing for {target}.")
+
+    # ==================================================================
+    # 09 — Similar Candidates
+    # ==================================================================
+    st.markdown(
+        "<p class='sec-title'><span class='accent'>09</span> Similar Candidates</p>",
+        unsafe_allow_html=True,
+    )
+    similar = _get_skill_index().most_similar(profile, k=20, exclude=result["content_id"])
+    if similar:
+        st.dataframe(
+            [
+                {"Candidate": label, "Similarity": round(score * 100, 1)}
+                for _, label, score in similar
+            ],
+            hide_index=True,
+            column_config={
+                "Similarity": st.column_config.ProgressColumn(
+                    "Similarity", format="%.1f%%", min_value=0, max_value=100
+                ),
+            },
+        )
+    else:
+        st.info("No other analyzed resumes share skills with this one yet.")
 
 
 if __name__ == "__main__":
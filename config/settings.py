@@ -0,0 +1,62 @@
+"""
+config — Runtime limits and tuning knobs for extraction and batch processing.
+"""
+
+import os
+
+# ---------------------------------------------------------------------------
+# Sandboxed extraction
+# ---------------------------------------------------------------------------
+# With the sandbox on, every session's batches share this one parser pool
+# and the warm worker pool below is unused; skill matching runs on batch
+# threads in the server process. The pool is sized to the batch workers
+# (utils.batch.DEFAULT_MAX_WORKERS) so no batch thread waits on a parser,
+# at the cost of up to SANDBOX_POOL_SIZE * SANDBOX_MAX_RSS_MB of memory.
+# Turn the sandbox off to trade that isolation for the warm pool, which
+# runs parsing and matching together across processes.
+SANDBOX_ENABLED = True              # run format parsers in supervised subprocesses
+SANDBOX_POOL_SIZE = min(8, os.cpu_count() or 1)  # parser processes kept warm and reused
+SANDBOX_TIMEOUT_S = 15.0            # wall-clock limit per document
+SANDBOX_MAX_RSS_MB = 512            # resident memory cap per parser process
+SANDBOX_MAX_TEXT_CHARS = 2_000_000  # extracted text beyond this is rejected
+
+# ---------------------------------------------------------------------------
+# Warm worker pool
+# ---------------------------------------------------------------------------
+WORKER_POOL_SIZE = min(8, os.cpu_count() or 1)  # pre-forked analysis workers
+WORKER_MAX_JOBS = 500               # recycle a worker after this many jobs
+WORKER_MAX_RSS_MB = 1024            # ...or once its resident memory exceeds this
+
+# ---------------------------------------------------------------------------
+# Extractor backends
+# ---------------------------------------------------------------------------
+EXTRACTOR_SELECTION_PATH = os.path.join(  # written by scripts/calibrate_extractors.py
+    os.path.dirname(os.path.abspath(__file__)), "extractors.json"
+)
+EXTRACTOR_FALLBACK = True           # try the next backend on empty/garbled text
+EXTRACTOR_MIN_QUALITY = 0.5         # text_quality() below this counts as garbled
+
+# ---------------------------------------------------------------------------
+# ZIP archive ingestion
+# ---------------------------------------------------------------------------
+ZIP_MAX_MEMBERS = 1000              # resumes accepted from a single archive
+ZIP_MAX_TOTAL_MB = 500              # total uncompressed bytes read from an archive
+ZIP_MAX_RATIO = 100                 # uncompressed / compressed size per member
+
+# ---------------------------------------------------------------------------
+# Analysis store (server-wide LRU)
+# ---------------------------------------------------------------------------
+STORE_MAX_MB = 256                  # global budget for stored analysis results
+STORE_SESSION_MAX_MB = 32           # share any one session may hold
+STORE_PREVIEW_CHARS = 5000          # text kept uncompressed for display
+
+# ---------------------------------------------------------------------------
+# Charts
+# ---------------------------------------------------------------------------
+CHART_CACHE_SIZE = 512              # memoized figure specs (JSON) kept per server
+
+# ---------------------------------------------------------------------------
+# Role recommendation
+# ---------------------------------------------------------------------------
+ROLE_WEIGHTS_PATH = None            # JSON role -> {skill: weight}; None = skills_db
+ROLE_TOP_K = 4                      # primary role + alternatives
@@ -51,42 +51,108 @@ SKILL_BENCHMARK = 12       # skills needed for full skill-count score
 DOMAIN_BENCHMARK = 3        # domains needed for full breadth score
 MAX_SCORE = 92.0            # hard cap — no resume is "perfect"
 
-# Role mapping
-ROLE_MAP: dict[str, dict] = {
-    "Machine Learning / AI": {
-        "primary": "Machine Learning Engineer",
-        "alternatives": ["AI Research Scientist", "NLP Engineer", "Data Scientist"],
-    },
-    "Web Development": {
-        "primary": "Frontend / Full Stack Developer",
-        "alternatives": ["UI Engineer", "Web Developer", "React Developer"],
-    },
-    "Data Science": {
-        "primary": "Data Analyst / Data Scientist",
-        "alternatives": [
-            "Business Intelligence Analyst",
-            "Analytics Engineer",
-            "Database Developer",
-        ],
-    },
-    "Cloud & DevOps": {
-        "primary": "Cloud Engineer",
-        "alternatives": [
-            "DevOps Engineer",
-            "Site Reliability Engineer",
-            "Infrastructure Engineer",
-        ],
-    },
-    "Programming": {
-        "primary": "Machine Learning Engineer",
-        "alternatives": [
-            "Backend Developer",
-            "Systems Programmer",
-            "Application Developer",
-        ],
-    },
-    "Tools": {
-        "primary": "Software Engineer/ML Engineer",
-        "alternatives": ["DevOps Engineer", "Systems Administrator"],
+# Role × skill weight matrix — keys are search terms from SKILLS_DB.
+# Weights express how characteristic a skill is of the role (1.0 = core,
+# 0.5 = common, 0.25 = nice to have). An external JSON file with the same
+# shape can replace this via config.settings.ROLE_WEIGHTS_PATH.
+ROLE_SKILL_WEIGHTS: dict[str, dict[str, float]] = {
+    "Machine Learning Engineer": {
+        "machine learning": 1.0, "deep learning": 1.0, "tensorflow": 1.0,
+        "pytorch": 1.0, "scikit-learn": 1.0, "keras": 0.5, "python": 0.5,
+        "numpy": 0.5, "pandas": 0.5, "docker": 0.25, "kubernetes": 0.25,
+        "aws": 0.25, "neural network": 0.5, "spark": 0.25,
+    },
+    "AI Research Scientist": {
+        "deep learning": 1.0, "neural network": 1.0, "pytorch": 1.0,
+        "reinforcement learning": 1.0, "transformers": 1.0, "machine learning": 0.5,
+        "tensorflow": 0.5, "computer vision": 0.5, "nlp": 0.5,
+        "natural language processing": 0.5, "python": 0.5, "statistics": 0.5,
+        "llm": 0.5,
+    },
+    "NLP Engineer": {
+        "nlp": 1.0, "natural language processing": 1.0, "transformers": 1.0,
+        "llm": 1.0, "pytorch": 0.5, "tensorflow": 0.5, "deep learning": 0.5,
+        "machine learning": 0.5, "python": 0.5, "rest api": 0.25,
+    },
+    "Computer Vision Engineer": {
+        "computer vision": 1.0, "opencv": 1.0, "deep learning": 1.0,
+        "pytorch": 0.5, "tensorflow": 0.5, "neural network": 0.5,
+        "python": 0.5, "c++": 0.5, "numpy": 0.25,
+    },
+    "Data Scientist": {
+        "statistics": 1.0, "machine learning": 1.0, "pandas": 1.0,
+        "numpy": 0.5, "scikit-learn": 1.0, "python": 0.5, "r programming": 0.5,
+        "sql": 0.5, "data analysis": 0.5, "data visualization": 0.5,
+        "matplotlib": 0.25, "seaborn": 0.25, "deep learning": 0.25,
+    },
+    "Data Analyst": {
+        "sql": 1.0, "excel": 1.0, "data analysis": 1.0, "power bi": 1.0,
+        "tableau": 1.0, "data visualization": 1.0, "statistics": 0.5,
+        "pandas": 0.5, "python": 0.25, "mysql": 0.25, "postgresql": 0.25,
+    },
+    "Business Intelligence Analyst": {
+        "power bi": 1.0, "tableau": 1.0, "sql": 1.0, "excel": 0.5,
+        "data visualization": 1.0, "etl": 0.5, "data analysis": 0.5,
+    },
+    "Data Engineer": {
+        "spark": 1.0, "hadoop": 1.0, "etl": 1.0, "sql": 1.0, "python": 0.5,
+        "scala": 0.5, "aws": 0.5, "gcp": 0.25, "azure": 0.25,
+        "postgresql": 0.5, "mongodb": 0.25, "docker": 0.25,
+    },
+    "Database Developer": {
+        "sql": 1.0, "postgresql": 1.0, "mysql": 1.0, "mongodb": 1.0,
+        "etl": 0.5, "python": 0.25,
+    },
+    "Frontend Developer": {
+        "react": 1.0, "angular": 1.0, "vue.js": 1.0, "javascript": 1.0,
+        "typescript": 1.0, "html": 1.0, "css": 1.0, "tailwind": 0.5,
+        "bootstrap": 0.5, "next.js": 0.5,
+    },
+    "Full Stack Developer": {
+        "javascript": 1.0, "typescript": 0.5, "react": 1.0, "node.js": 1.0,
+        "express.js": 0.5, "html": 0.5, "css": 0.5, "rest api": 1.0,
+        "graphql": 0.5, "sql": 0.5, "mongodb": 0.5, "django": 0.5,
+        "flask": 0.5, "next.js": 0.5, "docker": 0.25, "git": 0.25,
+    },
+    "Backend Developer": {
+        "java": 1.0, "python": 1.0, "go": 1.0, "node.js": 0.5, "django": 1.0,
+        "flask": 1.0, "express.js": 0.5, "rest api": 1.0, "graphql": 0.5,
+        "sql": 0.5, "postgresql": 0.5, "mongodb": 0.5, "docker": 0.5,
+        "kotlin": 0.5, "php": 0.5, "ruby": 0.5, "scala": 0.25,
+    },
+    "Mobile Developer": {
+        "swift": 1.0, "kotlin": 1.0, "java": 0.5, "react": 0.5,
+        "javascript": 0.25, "rest api": 0.5, "git": 0.25,
+    },
+    "Systems Programmer": {
+        "c language": 1.0, "c programming": 1.0, "c++": 1.0, "rust": 1.0,
+        "go": 0.5, "linux": 1.0, "bash": 0.5, "shell scripting": 0.5,
+    },
+    "Cloud Engineer": {
+        "aws": 1.0, "azure": 1.0, "gcp": 1.0, "terraform": 1.0,
+        "cloudformation": 1.0, "lambda": 0.5, "s3": 0.5, "ec2": 0.5,
+        "docker": 0.5, "kubernetes": 0.5, "linux": 0.25,
+    },
+    "DevOps Engineer": {
+        "docker": 1.0, "kubernetes": 1.0, "ci/cd": 1.0, "jenkins": 1.0,
+        "ansible": 1.0, "terraform": 1.0, "aws": 0.5, "linux": 0.5,
+        "bash": 0.5, "shell scripting": 0.5, "git": 0.5, "github": 0.25,
+        "gitlab": 0.5, "python": 0.25,
+    },
+    "Site Reliability Engineer": {
+        "kubernetes": 1.0, "linux": 1.0, "docker": 0.5, "terraform": 0.5,
+        "aws": 0.5, "gcp": 0.5, "bash": 0.5, "shell scripting": 0.5,
+        "python": 0.5, "go": 0.5, "ci/cd": 0.5, "ansible": 0.5,
+    },
+    "Systems Administrator": {
+        "linux": 1.0, "bash": 1.0, "shell scripting": 1.0, "ansible": 0.5,
+        "docker": 0.25, "git": 0.25, "azure": 0.25,
+    },
+    "Software Engineer": {
+        "python": 0.5, "java": 0.5, "c++": 0.5, "javascript": 0.5,
+        "typescript": 0.5, "go": 0.5, "git": 1.0, "github": 0.5,
+        "gitlab": 0.5, "jira": 0.5, "confluence": 0.25, "vs code": 0.25,
+        "postman": 0.5, "rest api": 0.5, "sql": 0.25, "linux": 0.5,
+        "docker": 0.25,
     },
 }
@@ -0,0 +1,143 @@
+"""
+Compare warm pre-forked workers with cold spawned ones — runs fully offline.
+============================================================================
+Run with:  python scripts/bench_workers.py --workers 32 --jobs 200
+
+Starts a ``WarmPool`` twice with the same number of workers. The cold pool
+uses the ``spawn`` start method, so each worker imports the parsers and
+builds the matcher itself. The warm pool forks from a preloaded
+forkserver (``utils.preload``). For each pool the report gives:
+- first-result latency, from pool creation to the first analyzed resume;
+- the time until every worker is up;
+- total RSS and PSS of all descendant processes. PSS splits shared pages
+  across the processes sharing them, so it shows copy-on-write savings.
+- throughput and the per-worker job spread for a batch of resumes.
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config.skills_db import SKILLS_DB  # noqa: E402
+from utils.batch import analyze_resume, iter_batch  # noqa: E402
+from utils.workers import WarmPool, worker_context  # noqa: E402
+
+
+def synthetic_resumes(count: int, seed: int = 0) -> list[tuple[str, bytes]]:
+    rng = random.Random(seed)
+    terms = [skill for skills in SKILLS_DB.values() for skill in skills]
+    items = []
+    for i in range(count):
+        words = rng.sample(terms, rng.randint(3, 25)) + ["experience"] * 400
+        rng.shuffle(words)
+        items.append((f"resume_{i:04d}.txt", " ".join(words).encode("utf-8")))
+    return items
+
+
+# ---------------------------------------------------------------------------
+# Memory accounting (/proc)
+# ---------------------------------------------------------------------------
+def _descendants(root: int) -> list[int]:
+    parents = {}
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            try:
+                with open(f"/proc/{entry}/stat") as fh:
+                    parents[int(entry)] = int(fh.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+    found, frontier = [], [root]
+    while frontier:
+        parent = frontier.pop()
+        children = [pid for pid, ppid in parents.items() if ppid == parent]
+        found.extend(children)
+        frontier.extend(children)
+    return found
+
+
+def _rollup_kb(pid: int, field: str) -> int:
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as fh:
+            for line in fh:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def memory_mb() -> dict:
+    pids = _descendants(os.getpid())
+    return {
+        "processes": len(pids),
+        "rss_mb": sum(_rollup_kb(p, "Rss") for p in pids) / 1024,
+        "pss_mb": sum(_rollup_kb(p, "Pss") for p in pids) / 1024,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+def run(label: str, ctx, workers: int, items: list[tuple[str, bytes]]) -> dict:
+    start = time.perf_counter()
+    pool = WarmPool(size=workers, mp_context=ctx)
+    first = pool.submit(analyze_resume, *items[0]).result()
+    first_s = time.perf_counter() - start
+    while not all(row["pid"] for row in pool.stats()):
+        time.sleep(0.01)
+    ready_s = time.perf_counter() - start
+    memory = memory_mb()
+
+    batch_start = time.perf_counter()
+    results = list(iter_batch(items, max_workers=workers, executor=pool))
+    batch_s = time.perf_counter() - batch_start
+    per_worker = [row["jobs"] for row in pool.stats()]
+    pool.shutdown()
+
+    assert first["status"] == "ok" and len(results) == len(items)
+    return {
+        "label": label,
+        "first_result_s": first_s,
+        "all_ready_s": ready_s,
+        **memory,
+        "jobs_per_s": len(items) / batch_s,
+        "jobs_per_worker": (min(per_worker), max(per_worker)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--jobs", type=int, default=200, help="resumes in the batch")
+    args = parser.parse_args()
+
+    items = synthetic_resumes(args.jobs)
+    rows = [
+        run("cold (spawn)", multiprocessing.get_context("spawn"), args.workers, items),
+        run("warm (preload)", worker_context(), args.workers, items),
+    ]
+
+    header = (
+        f"{'pool':<16}{'first ms':>10}{'ready ms':>10}{'procs':>7}"
+        f"{'RSS MB':>9}{'PSS MB':>9}{'jobs/s':>9}{'jobs/worker':>13}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in rows:
+        lo, hi = r["jobs_per_worker"]
+        print(
+            f"{r['label']:<16}{r['first_result_s'] * 1000:>10.0f}"
+            f"{r['all_ready_s'] * 1000:>10.0f}{r['processes']:>7}"
+            f"{r['rss_mb']:>9.0f}{r['pss_mb']:>9.0f}{r['jobs_per_s']:>9.1f}"
+            f"{f'{lo}–{hi}':>13}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Benchmark installed extractor backends and pick the fastest acceptable one.
+===========================================================================
+Run with:  python scripts/calibrate_extractors.py path/to/resumes
+
+Every PDF, DOCX and TXT file under the corpus directory is sniffed, then
+parsed by each installed backend for its format (see ``utils.extractors``).
+Each backend is timed with the best of ``--repeat`` runs and its text is
+scored for quality. The score is ``text_quality()`` times coverage, where
+coverage is the backend's word count relative to the most any backend
+extracted from that file. This catches parsers that return clean but
+truncated text.
+
+For each format, the fastest backend that clears ``--min-quality`` on
+average and succeeds on at least ``--min-success`` of the files goes first.
+The remaining backends follow, best quality first, as the fallback chain.
+The selection is written to ``EXTRACTOR_SELECTION_PATH`` (or ``--output``)
+and is picked up by the app on its next start, with no code changes.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config.settings import (  # noqa: E402
+    EXTRACTOR_SELECTION_PATH,
+    EXTRACTOR_MIN_QUALITY,
+)
+from utils.extractors import (  # noqa: E402
+    FORMATS,
+    available_backends,
+    get_backend,
+    sniff_format,
+    text_quality,
+)
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------------
+def load_corpus(path: str) -> dict[str, list[tuple[str, bytes]]]:
+    """``{format: [(name, data), ...]}`` for every supported file under ``path``."""
+    corpus: dict[str, list[tuple[str, bytes]]] = {fmt: [] for fmt in FORMATS}
+    for dirpath, _, filenames in os.walk(path):
+        for name in sorted(filenames):
+            with open(os.path.join(dirpath, name), "rb") as fh:
+                data = fh.read()
+            fmt = sniff_format(data, name)
+            if fmt is not None:
+                corpus[fmt].append((name, data))
+    return corpus
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+def _time_backend(func, data: bytes, repeat: int) -> tuple[str | None, float, str]:
+    """Best-of-``repeat`` seconds and the text, or the error message."""
+    best = float("inf")
+    text = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            text = func(data)
+        except Exception as exc:
+            return None, 0.0, str(exc) or type(exc).__name__
+        best = min(best, time.perf_counter() - start)
+    return text, best, ""
+
+
+def benchmark_format(fmt: str, files: list[tuple[str, bytes]], repeat: int) -> dict:
+    """Per-backend timing and quality stats over ``files``."""
+    backends = available_backends(fmt)
+    runs: dict[str, list[dict]] = {b: [] for b in backends}
+    for name, data in files:
+        outputs = {}
+        for backend in backends:
+            text, seconds, error = _time_backend(get_backend(fmt, backend), data, repeat)
+            outputs[backend] = (text, seconds, error)
+        most_words = max(
+            (len(t.split()) for t, _, _ in outputs.values() if t), default=0
+        )
+        for backend, (text, seconds, error) in outputs.items():
+            if text is None:
+                runs[backend].append({"file": name, "error": error})
+                continue
+            coverage = len(text.split()) / most_words if most_words else 0.0
+            runs[backend].append(
+                {
+                    "file": name,
+                    "seconds": seconds,
+                    "bytes": len(data),
+                    "quality": text_quality(text) * coverage,
+                }
+            )
+
+    stats = {}
+    for backend, rows in runs.items():
+        ok = [r for r in rows if "error" not in r]
+        seconds = sum(r["seconds"] for r in ok)
+        stats[backend] = {
+            "files": len(rows),
+            "failures": len(rows) - len(ok),
+            "success_rate": len(ok) / len(rows) if rows else 0.0,
+            "median_ms": statistics.median(r["seconds"] for r in ok) * 1000 if ok else None,
+            "mb_per_s": sum(r["bytes"] for r in ok) / 2**20 / seconds if seconds else None,
+            "mean_quality": statistics.mean(r["quality"] for r in ok) if ok else 0.0,
+            "first_error": next((r["error"] for r in rows if "error" in r), ""),
+        }
+    return stats
+
+
+def choose_order(stats: dict, min_quality: float, min_success: float) -> list[str]:
+    """Fastest acceptable backend first, then the rest by quality."""
+    acceptable = [
+        b for b, s in stats.items()
+        if s["median_ms"] is not None
+        and s["mean_quality"] >= min_quality
+        and s["success_rate"] >= min_success
+    ]
+    by_quality = sorted(stats, key=lambda b: -stats[b]["mean_quality"])
+    if not acceptable:
+        return by_quality
+    fastest = min(acceptable, key=lambda b: stats[b]["median_ms"])
+    return [fastest] + [b for b in by_quality if b != fastest]
+
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+def print_report(results: dict, selection: dict) -> None:
+    header = (
+        f"{'format':<7}{'backend':<14}{'files':>6}{'fail':>6}"
+        f"{'median ms':>11}{'MB/s':>9}{'quality':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for fmt, stats in results.items():
+        for backend in selection[fmt]:
+            s = stats[backend]
+            median = f"{s['median_ms']:.2f}" if s["median_ms"] is not None else "-"
+            rate = f"{s['mb_per_s']:.1f}" if s["mb_per_s"] is not None else "-"
+            mark = " *" if backend == selection[fmt][0] else ""
+            print(
+                f"{fmt:<7}{backend:<14}{s['files']:>6}{s['failures']:>6}"
+                f"{median:>11}{rate:>9}{s['mean_quality']:>9.3f}{mark}"
+            )
+    print("\n* selected backend; the others form the fallback chain in order shown")
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("corpus", help="directory of sample resumes (searched recursively)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per file and backend")
+    parser.add_argument(
+        "--min-quality", type=float, default=EXTRACTOR_MIN_QUALITY,
+        help="mean quality a backend needs to be selected",
+    )
+    parser.add_argument(
+        "--min-success", type=float, default=0.95,
+        help="share of files a backend must parse without error",
+    )
+    parser.add_argument("--output", default=EXTRACTOR_SELECTION_PATH)
+    parser.add_argument("--dry-run", action="store_true", help="report only; write nothing")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    if not any(corpus.values()):
+        sys.exit(f"No PDF/DOCX/TXT files found in {args.corpus}")
+
+    results, selection = {}, {}
+    for fmt, files in corpus.items():
+        if files:
+            results[fmt] = benchmark_format(fmt, files, args.repeat)
+            selection[fmt] = choose_order(results[fmt], args.min_quality, args.min_success)
+    print_report(results, selection)
+
+    if not args.dry_run:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(
+                {
+                    "created": datetime.datetime.now().isoformat(timespec="seconds"),
+                    "corpus": os.path.abspath(args.corpus),
+                    "selection": selection,
+                    "benchmark": results,
+                },
+                fh,
+                indent=2,
+            )
+        print(f"\nSelection written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
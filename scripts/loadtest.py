@@ -0,0 +1,324 @@
+"""
+Concurrent-session load test for the Streamlit app — runs fully offline.
+=========================================================================
+Run with:  python scripts/loadtest.py --sessions 16 --rounds 5
+
+Each simulated session drives ``app.py`` headlessly through
+``streamlit.testing.v1.AppTest``. It uploads a batch of resumes from a
+fixture corpus and opens one row of the batch summary. It then uploads a
+single resume, which opens its details directly, flips the theme, and
+switches to the corpus view and back. Both detail steps run the full
+analysis page, including charts, role cards, gaps and similar candidates.
+Every rerun is timed. The report gives rerun latency percentiles (overall and per
+step) plus CPU time and RSS per session. Both include child processes
+(sandboxed parsers, warm workers and their forkserver), read from /proc,
+since that is where PDF and DOCX parsing runs.
+
+Sessions run as threads in one process by default, like one ``streamlit run``
+server sharing caches and pools. CPU and RSS are then reported for the whole
+server and as an even share per session. Use ``--isolate`` to run each
+session in its own process and measure CPU and RSS for each one exactly.
+Expanders need no separate step: Streamlit runs their bodies on every rerun,
+and expanding one only changes the browser view.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import resource
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from config.skills_db import SKILLS_DB  # noqa: E402
+from bench_workers import _descendants, _rollup_kb  # noqa: E402
+
+APP_PATH = os.path.join(ROOT, "app.py")
+MIME_TYPES = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".txt": "text/plain",
+    ".zip": "application/zip",
+}
+
+
+# ---------------------------------------------------------------------------
+# Fixture corpus
+# ---------------------------------------------------------------------------
+def load_corpus(path: str | None, size: int, seed: int) -> list[tuple[str, bytes, str]]:
+    """Read resumes from ``path``, or synthesize ``size`` TXT resumes offline."""
+    if path:
+        corpus = []
+        for name in sorted(os.listdir(path)):
+            ext = os.path.splitext(name)[1].lower()
+            if ext in MIME_TYPES:
+                with open(os.path.join(path, name), "rb") as fh:
+                    corpus.append((name, fh.read(), MIME_TYPES[ext]))
+        if not corpus:
+            sys.exit(f"No PDF/DOCX/TXT/ZIP files found in {path}")
+        return corpus
+
+    rng = random.Random(seed)
+    terms = [skill for skills in SKILLS_DB.values() for skill in skills]
+    filler = "responsible for delivering projects with cross functional teams".split()
+    corpus = []
+    for i in range(size):
+        words = rng.sample(terms, rng.randint(3, 25))
+        words += rng.choices(filler, k=rng.randint(200, 1500))
+        rng.shuffle(words)
+        text = f"Candidate {i}\n" + " ".join(words)
+        corpus.append((f"synthetic_{i:04d}.txt", text.encode("utf-8"), "text/plain"))
+    return corpus
+
+
+# ---------------------------------------------------------------------------
+# One session
+# ---------------------------------------------------------------------------
+def _rss_mb() -> float:
+    """RSS of this process plus every descendant (sandbox and pool workers)."""
+    try:
+        with open("/proc/self/statm") as fh:
+            own = int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return own + sum(_rollup_kb(p, "Rss") for p in _descendants(os.getpid())) / 1024
+
+
+def _cpu_s() -> float:
+    """
+    CPU seconds used by this process and its descendants so far.
+
+    Live descendants are read from /proc, including the children they have
+    reaped, e.g. recycled workers under the forkserver. Reaped direct
+    children come from ``os.times``.
+    """
+    times = os.times()
+    total = time.process_time() + times.children_user + times.children_system
+    ticks = os.sysconf("SC_CLK_TCK")
+    for pid in _descendants(os.getpid()):
+        try:
+            with open(f"/proc/{pid}/stat") as fh:
+                fields = fh.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        # utime, stime, cutime, cstime
+        total += sum(int(v) for v in fields[11:15]) / ticks
+    return total
+
+
+def run_session(
+    session_id: int, corpus, rounds: int, batch: int, timeout: float
+) -> dict:
+    """Drive one app session and return its timings and resource usage."""
+    rng = random.Random(session_id)
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    timings: list[tuple[str, float]] = []
+    errors: list[str] = []
+    cpu_start = _cpu_s()
+
+    def step(name, action=None):
+        if action is not None:
+            action()
+        start = time.perf_counter()
+        at.run()
+        timings.append((name, time.perf_counter() - start))
+        errors.extend(str(e.value) for e in at.exception)
+
+    def select_row():
+        rows = len(at.dataframe(key="_batch_table").value)
+        at.session_state["_batch_table"] = {
+            "selection": {"rows": [rng.randrange(rows)], "columns": [], "cells": []}
+        }
+
+    step("initial")
+    for _ in range(rounds):
+        files = rng.sample(corpus, min(batch, len(corpus)))
+        step("upload", lambda: at.file_uploader[0].set_value(files))
+        if any(df.key == "_batch_table" for df in at.dataframe):
+            step("select_row", select_row)
+        single = [rng.choice(corpus)]
+        step("single_upload", lambda: at.file_uploader[0].set_value(single))
+        step("theme", lambda: at.toggle(key="_theme_toggle").set_value(
+            not at.toggle(key="_theme_toggle").value
+        ))
+        step("corpus_view", lambda: at.radio(key="_view").set_value("Corpus"))
+        step("analyzer_view", lambda: at.radio(key="_view").set_value("Analyzer"))
+
+    return {
+        "session": session_id,
+        "timings": timings,
+        "errors": errors,
+        # Only meaningful with one session per process (--isolate)
+        "cpu_s": _cpu_s() - cpu_start,
+        "rss_mb": _rss_mb(),
+    }
+
+
+def _session_worker(args) -> dict:
+    """Run one session; a harness failure is reported, not raised."""
+    try:
+        return run_session(*args)
+    except Exception as exc:
+        return {
+            "session": args[0],
+            "timings": [],
+            "errors": [f"session {args[0]} failed: {type(exc).__name__}: {exc}"],
+            "cpu_s": 0.0,
+            "rss_mb": _rss_mb(),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+def percentiles(values: list[float]) -> dict:
+    ordered = sorted(values)
+    if len(ordered) < 2:
+        only = ordered[0] if ordered else 0.0
+        return {"p50": only, "p90": only, "p95": only, "p99": only, "max": only}
+    cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+    return {
+        "p50": cuts[49],
+        "p90": cuts[89],
+        "p95": cuts[94],
+        "p99": cuts[98],
+        "max": ordered[-1],
+    }
+
+
+def build_report(
+    sessions: list[dict], wall_s: float, server_cpu_s: float, args
+) -> dict:
+    all_latencies = [t for s in sessions for _, t in s["timings"]]
+    server_rss_mb = _rss_mb()
+    by_step: dict[str, list[float]] = {}
+    for s in sessions:
+        for name, t in s["timings"]:
+            by_step.setdefault(name, []).append(t)
+    return {
+        "sessions": len(sessions),
+        "mode": "processes" if args.isolate else "threads",
+        "reruns": len(all_latencies),
+        "wall_s": wall_s,
+        "reruns_per_s": len(all_latencies) / wall_s if wall_s else 0.0,
+        "latency_s": percentiles(all_latencies),
+        "latency_by_step_s": {k: percentiles(v) for k, v in by_step.items()},
+        "cpu_s_per_session": (
+            [s["cpu_s"] for s in sessions]
+            if args.isolate
+            else [server_cpu_s / len(sessions)] * len(sessions)
+        ),
+        "rss_mb_per_session": (
+            [s["rss_mb"] for s in sessions]
+            if args.isolate
+            else [server_rss_mb / len(sessions)] * len(sessions)
+        ),
+        "server_cpu_s": server_cpu_s if not args.isolate else None,
+        "server_rss_mb": server_rss_mb if not args.isolate else None,
+        "errors": [e for s in sessions for e in s["errors"]],
+    }
+
+
+def print_report(report: dict) -> None:
+    print(
+        f"\n{report['sessions']} session(s) [{report['mode']}], "
+        f"{report['reruns']} reruns in {report['wall_s']:.1f}s "
+        f"({report['reruns_per_s']:.1f} reruns/s)\n"
+    )
+    header = f"{'step':<15}{'p50':>9}{'p90':>9}{'p95':>9}{'p99':>9}{'max':>9}   (ms)"
+    print(header)
+    print("-" * len(header))
+    rows = [("all", report["latency_s"]), *report["latency_by_step_s"].items()]
+    for name, pct in rows:
+        keys = ("p50", "p90", "p95", "p99", "max")
+        cells = "".join(f"{pct[k] * 1000:>9.0f}" for k in keys)
+        print(f"{name:<15}{cells}")
+
+    cpu = report["cpu_s_per_session"]
+    rss = report["rss_mb_per_session"]
+    if report["server_cpu_s"] is not None:
+        print(
+            f"\nServer: {report['server_cpu_s']:.2f}s CPU, "
+            f"{report['server_rss_mb']:.0f} MB RSS (per-session figures are shares)"
+        )
+    print(
+        f"\nCPU per session: mean {statistics.mean(cpu):.2f}s, max {max(cpu):.2f}s"
+        f"\nRSS per session: mean {statistics.mean(rss):.0f} MB, max {max(rss):.0f} MB"
+    )
+    if report["errors"]:
+        print(f"\n{len(report['errors'])} app exception(s); first: {report['errors'][0]}")
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sessions", type=int, default=8, help="concurrent sessions")
+    parser.add_argument("--rounds", type=int, default=3, help="scenario loops per session")
+    parser.add_argument("--batch", type=int, default=3, help="files per upload")
+    parser.add_argument("--corpus", help="fixture directory (default: synthetic resumes)")
+    parser.add_argument("--corpus-size", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=120.0, help="per-rerun timeout (s)")
+    parser.add_argument("--isolate", action="store_true", help="one process per session")
+    parser.add_argument("--json", help="also write the report to this file")
+    parser.add_argument(
+        "--fail-p95-ms", type=float,
+        help="exit non-zero if overall p95 rerun latency exceeds this",
+    )
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus, args.corpus_size, args.seed)
+    jobs = [
+        (i, corpus, args.rounds, args.batch, args.timeout)
+        for i in range(args.sessions)
+    ]
+
+    start = time.perf_counter()
+    cpu_start = _cpu_s()
+    if args.isolate:
+        # Not multiprocessing.Pool: its daemonic workers cannot start the
+        # sandbox's parser processes.
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(args.sessions, mp_context=ctx) as pool:
+            sessions = list(pool.map(_session_worker, jobs))
+    else:
+        sessions = [None] * args.sessions
+        threads = [
+            threading.Thread(
+                target=lambda i=i: sessions.__setitem__(i, _session_worker(jobs[i]))
+            )
+            for i in range(args.sessions)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    wall_s = time.perf_counter() - start
+    server_cpu_s = _cpu_s() - cpu_start
+
+    report = build_report(sessions, wall_s, server_cpu_s, args)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(report, fh, indent=2)
+
+    p95_ms = report["latency_s"]["p95"] * 1000
+    if args.fail_p95_ms is not None and p95_ms > args.fail_p95_ms:
+        sys.exit(f"\np95 {p95_ms:.0f} ms exceeds budget of {args.fail_p95_ms:.0f} ms")
+    if report["errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,70 +5,56 @@ utils — Core analysis functions: extraction, preprocessing, skills, scoring, r
 import re
 from collections import Counter
 
-import PyPDF2
-import docx
-
 from config.skills_db import (
     SKILLS_DB,
-    DISPLAY_NAME_OVERRIDES,
     SKILL_BENCHMARK,
     DOMAIN_BENCHMARK,
     MAX_SCORE,
-    ROLE_MAP,
 )
+from utils.extractors import extract
+from utils.roles import get_default_engine
+from utils.taxonomy import SKILL_TAXONOMY, display_name
 
 
 # ---------------------------------------------------------------------------
 # Text Extraction
 # ---------------------------------------------------------------------------
 def extract_text(uploaded_file) -> str:
-    """Detect file type and extract raw text from the uploaded resume."""
-    filename = uploaded_file.name.lower()
-
-    if filename.endswith(".pdf"):
-        return _extract_from_pdf(uploaded_file)
-    elif filename.endswith(".docx"):
-        return _extract_from_docx(uploaded_file)
-    elif filename.endswith(".txt"):
-        return _extract_from_txt(uploaded_file)
-    else:
-        raise ValueError(
-            "Unsupported file format. Please upload a PDF, DOCX, or TXT file."
-        )
-
-
-def _extract_from_pdf(file) -> str:
-    """Extract text from a PDF file using PyPDF2."""
-    reader = PyPDF2.PdfReader(file)
-    pages = [page.extract_text() or "" for page in reader.pages]
-    return "\n".join(pages)
-
-
-def _extract_from_docx(file) -> str:
-    """Extract text from a DOCX file using python-docx."""
-    doc = docx.Document(file)
-    return "\n".join(paragraph.text for paragraph in doc.paragraphs)
-
-
-def _extract_from_txt(file) -> str:
-    """Read plain-text file content."""
-    return file.read().decode("utf-8", errors="ignore")
+    """Sniff the file type and extract raw text with the configured backends."""
+    return extract(uploaded_file.read(), uploaded_file.name)
 
 
 # ---------------------------------------------------------------------------
 # Text Preprocessing
 # ---------------------------------------------------------------------------
+_NON_SKILL_CHARS = re.compile(r"[^a-z0-9\s\+\.\/#\-]")
+_WHITESPACE = re.compile(r"\s+")
+
+
 def preprocess_text(raw_text: str) -> str:
     """Clean and normalize resume text for skill matching."""
     text = raw_text.lower()
-    text = re.sub(r"[^a-z0-9\s\+\.\/#\-]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _NON_SKILL_CHARS.sub(" ", text)
+    text = _WHITESPACE.sub(" ", text).strip()
     return text
 
 
 # ---------------------------------------------------------------------------
 # Skill Extraction
 # ---------------------------------------------------------------------------
+# Compiled once at import; forked workers share them (see ``utils.preload``).
+_SKILL_PATTERNS: dict[str, list[tuple[str, re.Pattern]]] = {
+    domain: [
+        (display_name(skill), re.compile(rf"(?<![a-z]){re.escape(skill)}(?![a-z+])"))
+        for skill in skills
+    ]
+    for domain, skills in SKILLS_DB.items()
+}
+_MENTION_PATTERNS: dict[str, re.Pattern] = {
+    name: re.compile(re.escape(name.lower())) for name in SKILL_TAXONOMY
+}
+
+
 def extract_skills(cleaned_text: str) -> dict[str, list[str]]:
     """
     Match skills from the resume text against the skills dictionary.
@@ -77,17 +63,13 @@ def extract_skills(cleaned_text: str) -> dict[str, list[str]]:
     """
     detected: dict[str, list[str]] = {}
 
-    for domain, skills in SKILLS_DB.items():
+    for domain, patterns in _SKILL_PATTERNS.items():
         matched: list[str] = []
         seen_display: set[str] = set()
-        for skill in skills:
-            pattern = re.escape(skill)
-            regex = rf"(?<![a-z]){pattern}(?![a-z+])"
-            if re.search(regex, cleaned_text):
-                display = DISPLAY_NAME_OVERRIDES.get(skill, skill.title())
-                if display not in seen_display:
-                    matched.append(display)
-                    seen_display.add(display)
+        for display, regex in patterns:
+            if display not in seen_display and regex.search(cleaned_text):
+                matched.append(display)
+                seen_display.add(display)
         if matched:
             detected[domain] = matched
 
@@ -101,8 +83,10 @@ def count_skill_frequencies(
     freq: Counter = Counter()
     for skills in detected_skills.values():
         for skill in skills:
-            pattern = re.escape(skill.lower())
-            freq[skill] = len(re.findall(pattern, cleaned_text))
+            pattern = _MENTION_PATTERNS.get(skill)
+            if pattern is None:
+                pattern = re.compile(re.escape(skill.lower()))
+            freq[skill] = len(pattern.findall(cleaned_text))
     return freq
 
 
@@ -138,12 +122,18 @@ def calculate_strength_score(detected_skills: dict[str, list[str]]) -> float:
 # Job Role Recommendation
 # ---------------------------------------------------------------------------
 def recommend_role(detected_skills: dict[str, list[str]]) -> dict:
-    """Recommend a primary job role and alternatives based on dominant domains."""
+    """
+    Recommend a primary job role and alternatives.
+
+    Roles are ranked by affinity to the role × skill weight matrix (see
+    ``utils.roles``); ``role_scores`` lists them with match percentages.
+    """
     if not detected_skills:
         return {
             "primary": "Unable to determine – not enough skills detected",
             "alternatives": [],
             "dominant_domain": "N/A",
+            "role_scores": [],
         }
 
     domain_counts = {d: len(s) for d, s in detected_skills.items()}
@@ -154,18 +144,14 @@ def recommend_role(detected_skills: dict[str, list[str]]) -> dict:
     if len(sorted_domains) >= 2:
         diff = domain_counts[sorted_domains[0]] - domain_counts[sorted_domains[1]]
         if diff <= 1:
-            return {
-                "primary": "Software Engineer",
-                "alternatives": [
-                    ROLE_MAP.get(sorted_domains[0], {}).get("primary", "Software Engineer"),
-                    ROLE_MAP.get(sorted_domains[1], {}).get("primary", "Software Engineer"),
-                ],
-                "dominant_domain": "Mixed Technical",
-            }
-
-    entry = ROLE_MAP.get(dominant, {"primary": "Software Engineer", "alternatives": []})
+            dominant = "Mixed Technical"
+
+    ranked = get_default_engine().recommend(detected_skills)
+    if not ranked:
+        ranked = [("Software Engineer", 0.0)]
     return {
-        "primary": entry["primary"],
-        "alternatives": entry["alternatives"],
+        "primary": ranked[0][0],
+        "alternatives": [role for role, _ in ranked[1:]],
         "dominant_domain": dominant,
+        "role_scores": [(role, round(score * 100, 1)) for role, score in ranked],
     }
@@ -0,0 +1,136 @@
+"""
+archive — Stream resumes out of ZIP archives without extracting to disk.
+"""
+
+import io
+import posixpath
+import zipfile
+import zlib
+from typing import Iterable, Iterator
+
+from config.settings import ZIP_MAX_MEMBERS, ZIP_MAX_TOTAL_MB, ZIP_MAX_RATIO
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx", ".txt")
+_READ_CHUNK = 64 * 1024
+
+
+class ArchiveError(ValueError):
+    """Raised when an archive is unreadable or breaks an ingestion limit."""
+
+
+def is_archive(name: str) -> bool:
+    return name.lower().endswith(".zip")
+
+
+def _resume_members(zf: zipfile.ZipFile) -> list[zipfile.ZipInfo]:
+    """Members that look like resumes, skipping folders and OS metadata."""
+    members = []
+    for info in zf.infolist():
+        base = posixpath.basename(info.filename)
+        if info.is_dir() or info.filename.startswith("__MACOSX/"):
+            continue
+        if base.startswith(".") or not base.lower().endswith(SUPPORTED_EXTENSIONS):
+            continue
+        members.append(info)
+    return members
+
+
+def count_zip_members(fileobj) -> int:
+    """Number of resume members, read from the central directory only."""
+    try:
+        with zipfile.ZipFile(fileobj) as zf:
+            return len(_resume_members(zf))
+    except zipfile.BadZipFile as exc:
+        raise ArchiveError(f"Not a valid ZIP archive: {exc}") from exc
+
+
+def iter_zip_members(
+    fileobj,
+    max_members: int = ZIP_MAX_MEMBERS,
+    max_total_mb: int = ZIP_MAX_TOTAL_MB,
+    max_ratio: float = ZIP_MAX_RATIO,
+    only: str | None = None,
+) -> Iterator[tuple[str, bytes | ArchiveError]]:
+    """
+    Yield ``(member_name, data)`` for each resume in a ZIP, one at a time.
+
+    Members are decompressed straight into memory. Limits are enforced on
+    the bytes actually inflated rather than on header sizes, which a
+    crafted archive can misreport. A member that cannot be read (encrypted,
+    corrupt, bad CRC, over the ratio limit) is yielded with an
+    ``ArchiveError`` as ``data`` and the remaining members still follow.
+    Only archive-wide failures (unreadable archive, member count, total
+    size) raise. Pass ``only`` to read just the member with that name.
+    """
+    max_total = max_total_mb * 1024 * 1024
+    total = 0
+    try:
+        zf = zipfile.ZipFile(fileobj)
+    except (zipfile.BadZipFile, zipfile.LargeZipFile) as exc:
+        raise ArchiveError(f"Not a valid ZIP archive: {exc}") from exc
+
+    with zf:
+        members = _resume_members(zf)
+        if len(members) > max_members:
+            raise ArchiveError(
+                f"Archive holds {len(members)} resumes; the limit is {max_members}."
+            )
+        if only is not None:
+            members = [info for info in members if info.filename == only]
+        for info in members:
+            member_limit = max_ratio * max(info.compress_size, 1)
+            chunks: list[bytes] = []
+            size = 0
+            try:
+                with zf.open(info) as member:
+                    while chunk := member.read(_READ_CHUNK):
+                        size += len(chunk)
+                        total += len(chunk)
+                        if total > max_total:
+                            raise ArchiveError(
+                                f"Archive exceeds {max_total_mb} MB uncompressed."
+                            )
+                        if size > member_limit:
+                            yield info.filename, ArchiveError(
+                                f"{info.filename} exceeds the {max_ratio:g}:1 "
+                                "compression ratio limit."
+                            )
+                            break
+                        chunks.append(chunk)
+                    else:
+                        yield info.filename, b"".join(chunks)
+            except (
+                zipfile.BadZipFile,
+                NotImplementedError,
+                RuntimeError,
+                EOFError,
+                zlib.error,
+            ) as exc:
+                yield info.filename, ArchiveError(
+                    f"{info.filename} could not be read: {exc}"
+                )
+
+
+def expand_archives(
+    items: Iterable[tuple[str, bytes] | tuple[str, str, bytes]],
+) -> Iterator[tuple[str, str, bytes | ArchiveError]]:
+    """
+    Expand ``(name, data)`` pairs, streaming ZIP members in place of archives.
+
+    Items may also be ``(source, name, data)`` to tag results with an id
+    other than the name, e.g. to tell apart uploads that share a file name.
+    Yields ``(source, name, data)``, where ``source`` defaults to the item's
+    name. A member that cannot be read, or an archive that fails mid-way,
+    yields its ``ArchiveError`` as ``data`` so callers can report it
+    without losing the other members.
+    """
+    for item in items:
+        source, name, data = item if len(item) == 3 else (item[0], *item)
+        if not is_archive(name):
+            yield source, name, data
+            continue
+        try:
+            for member, member_data in iter_zip_members(io.BytesIO(data)):
+                yield source, f"{name}/{member}", member_data
+        except ArchiveError as exc:
+            yield source, name, exc
@@ -0,0 +1,198 @@
+"""
+batch — Analyze many resumes concurrently through a bounded worker pool.
+"""
+
+import hashlib
+import io
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Iterable, Iterator
+
+from utils.analyzer import (
+    extract_text,
+    preprocess_text,
+    extract_skills,
+    count_skill_frequencies,
+    calculate_strength_score,
+    recommend_role,
+)
+from utils.archive import ArchiveError, expand_archives
+from utils.sandbox import extract_text_sandboxed
+from utils.workers import worker_context
+
+DEFAULT_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+# ---------------------------------------------------------------------------
+# Single resume
+# ---------------------------------------------------------------------------
+def _result(
+    name: str, size: int, status: str = "ok", reason: str = "", message: str = ""
+) -> dict:
+    """Skeleton result; failures carry only these keys."""
+    return {
+        "file_id": f"{name}_{size}",
+        "file_name": name,
+        "status": status,
+        "error": message,
+        "error_reason": reason,
+    }
+
+
+def analyze_resume(name: str, data: bytes, sandboxed: bool = False) -> dict:
+    """
+    Run the full analysis pipeline on one resume given as raw bytes.
+
+    Never raises: failures are reported through the ``status``, ``error``
+    and ``error_reason`` keys so one bad file cannot abort a batch. With
+    ``sandboxed`` the format parsers run in the shared sandbox pool.
+    """
+    buffer = io.BytesIO(data)
+    buffer.name = name
+    try:
+        if sandboxed:
+            raw_text = extract_text_sandboxed(buffer)
+        else:
+            raw_text = extract_text(buffer)
+    except Exception as exc:
+        reason = getattr(exc, "reason", "parse_error")
+        return _result(name, len(data), "error", reason, str(exc))
+    if not raw_text.strip():
+        return _result(name, len(data), "empty", "empty", "No text could be extracted.")
+
+    cleaned = preprocess_text(raw_text)
+    detected = extract_skills(cleaned)
+    result = _result(name, len(data))
+    result.update(
+        {
+            # file_id (name + size) can collide across uploads; this cannot
+            "content_id": hashlib.blake2b(data, digest_size=16).hexdigest(),
+            "raw_text": raw_text,
+            "detected": detected,
+            "total_skills": sum(len(v) for v in detected.values()),
+            "score": calculate_strength_score(detected),
+            "role_info": recommend_role(detected),
+            "frequencies": count_skill_frequencies(cleaned, detected),
+        }
+    )
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Many resumes
+# ---------------------------------------------------------------------------
+def iter_batch(
+    items: Iterable[tuple[str, bytes] | tuple[str, str, bytes]],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    executor=None,
+    sandboxed: bool = False,
+) -> Iterator[dict]:
+    """
+    Analyze ``(name, data)`` pairs concurrently, yielding results as they finish.
+
+    ``.zip`` items are streamed member by member into the pool (see
+    ``utils.archive``); every result carries a ``source`` key naming the
+    item it came from. Pass ``(source, name, data)`` items to choose that
+    key yourself. At most ``2 * max_workers`` jobs are in flight at
+    once, so ``items`` may be a lazy generator and memory stays bounded
+    regardless of batch size. A job whose worker crashes (or whose pool is
+    broken) yields an error result with reason ``crashed`` rather than
+    aborting the batch. Pass an ``executor`` (anything with ``submit``
+    returning a future) to reuse an existing pool; otherwise a thread pool
+    is created and closed here. Sandboxed extraction already runs in worker
+    processes, so a thread pool is the right executor for it.
+    """
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    limit = max(1, 2 * max_workers)
+    pending: dict = {}
+
+    def drain():
+        nonlocal pending
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            source, name = pending.pop(future)
+            try:
+                result = future.result()
+            except Exception as exc:  # worker died, pool broken
+                result = _result(name, 0, "error", "crashed", str(exc))
+            result["source"] = source
+            yield result
+
+    try:
+        for source, name, data in expand_archives(items):
+            if isinstance(data, ArchiveError):
+                result = _result(name, 0, "error", "archive", str(data))
+                result["source"] = source
+                yield result
+                continue
+            try:
+                future = executor.submit(analyze_resume, name, data, sandboxed)
+            except Exception as exc:  # e.g. BrokenProcessPool
+                result = _result(name, 0, "error", "crashed", str(exc))
+                result["source"] = source
+                yield result
+                continue
+            pending[future] = (source, name)
+            if len(pending) >= limit:
+                yield from drain()
+        while pending:
+            yield from drain()
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def create_process_pool(max_workers: int = DEFAULT_MAX_WORKERS) -> ProcessPoolExecutor:
+    """
+    Create a process pool for CPU-bound batches.
+
+    PDF parsing is pure Python and holds the GIL, so real parallelism needs
+    processes. ``forkserver`` is preferred where available because forking a
+    multi-threaded server (e.g. Streamlit) directly is unsafe. For a
+    long-lived pool with warm, recycled workers see ``utils.workers.WarmPool``.
+    """
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=worker_context())
+
+
+def analyze_batch(
+    items: Iterable[tuple[str, bytes] | tuple[str, str, bytes]],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    executor=None,
+    sandboxed: bool = False,
+) -> list[dict]:
+    """Analyze a batch of resumes and return results in completion order."""
+    return list(
+        iter_batch(
+            items, max_workers=max_workers, executor=executor, sandboxed=sandboxed
+        )
+    )
+
+
+def summarize_result(result: dict, top_n: int = 3) -> dict:
+    """Flatten one result into a row for the batch summary table."""
+    if result["status"] != "ok":
+        return {
+            "File": result["file_name"],
+            "Status": result["error"],
+            "Score": None,
+            "Role": "",
+            "Top Skills": "",
+        }
+    top = [skill for skill, _ in result["frequencies"].most_common(top_n)]
+    return {
+        "File": result["file_name"],
+        "Status": "OK",
+        "Score": result["score"],
+        "Role": result["role_info"]["primary"],
+        "Top Skills": ", ".join(top),
+    }
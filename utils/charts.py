@@ -1,95 +1,430 @@
 """
 charts — Plotly chart builders for the analytics section (theme-aware).
+
+Builders assemble plain dict specs instead of validated graph objects. The
+serialized spec is memoized on a digest of the builder's arguments (data and
+theme), so reruns and theme flips back to a seen theme reuse it. Each call
+returns a fresh ``go.Figure`` made from the cached JSON with validation
+skipped. ``export_chart_summaries`` renders the per-resume charts for many
+results at once as static HTML, PNG or SVG.
 """
 
-from collections import Counter
+import functools
+import hashlib
+import html
+import inspect
+import json
+import os
+import threading
+from collections import Counter, OrderedDict
+from urllib.parse import quote
 
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
 
+from config.settings import CHART_CACHE_SIZE
 from styles.theme import CHART_COLORS
 
+_TRANSPARENT = "rgba(0,0,0,0)"
+
+
+# ---------------------------------------------------------------------------
+# Memoization
+# ---------------------------------------------------------------------------
+def _jsonable(obj):
+    return obj.tolist() if hasattr(obj, "tolist") else list(obj)
+
+
+_spec_cache: OrderedDict[str, str] = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+def chart_digest(*parts) -> str:
+    """
+    Stable digest of JSON-serializable chart inputs.
+
+    Mapping order is kept, not sorted, because it decides label order and
+    ``most_common`` tie-breaking in the rendered chart.
+    """
+    payload = json.dumps(
+        parts, separators=(",", ":"), ensure_ascii=False, default=_jsonable
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _memoized_figure(spec_builder):
+    """
+    Turn a ``(...) -> dict`` spec builder into a memoized ``go.Figure`` builder.
+
+    The raw spec builder stays reachable as ``.spec`` for callers (like the
+    batch export) that want the dict.
+    """
+    signature = inspect.signature(spec_builder)
+
+    @functools.wraps(spec_builder)
+    def builder(*args, **kwargs) -> go.Figure:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = chart_digest(spec_builder.__name__, bound.arguments)
+        with _cache_lock:
+            spec_json = _spec_cache.get(key)
+            if spec_json is not None:
+                _spec_cache.move_to_end(key)
+                _cache_stats["hits"] += 1
+        if spec_json is None:
+            spec_json = json.dumps(
+                spec_builder(*bound.args, **bound.kwargs), default=_jsonable
+            )
+            with _cache_lock:
+                _cache_stats["misses"] += 1
+                _spec_cache[key] = spec_json
+                while len(_spec_cache) > CHART_CACHE_SIZE:
+                    _spec_cache.popitem(last=False)
+        return go.Figure(json.loads(spec_json), _validate=False)
+
+    builder.spec = spec_builder
+    return builder
+
+
+def chart_cache_info() -> dict:
+    with _cache_lock:
+        return {
+            **_cache_stats,
+            "entries": len(_spec_cache),
+            "max_entries": CHART_CACHE_SIZE,
+        }
+
+
+def clear_chart_cache() -> None:
+    with _cache_lock:
+        _spec_cache.clear()
+        _cache_stats.update(hits=0, misses=0)
+
 
 # ---------------------------------------------------------------------------
 # Pie Chart – Skill distribution by domain
 # ---------------------------------------------------------------------------
+@_memoized_figure
 def build_pie_chart(
     detected_skills: dict[str, list[str]],
     theme: str = "dark",
-) -> go.Figure:
+) -> dict:
     """Donut chart of skill distribution, styled for the active theme."""
-    pal = CHART_COLORS[theme]
     labels = list(detected_skills.keys())
     values = [len(v) for v in detected_skills.values()]
+    return _donut(labels, values, theme)
+
+
+@_memoized_figure
+def build_share_pie_chart(
+    counts: Counter,
+    theme: str = "dark",
+    value_label: str = "Skills",
+) -> dict:
+    """Donut chart of pre-counted categories (e.g. corpus domain mix)."""
+    labels = [label for label, _ in counts.most_common()]
+    values = [value for _, value in counts.most_common()]
+    return _donut(labels, values, theme, value_label)
 
-    fig = go.Figure(
-        go.Pie(
-            labels=labels,
-            values=values,
-            hole=0.45,
-            marker=dict(
-                colors=pal["pie_colors"][: len(labels)],
-                line=dict(color=pal["pie_line"], width=2),
-            ),
-            textinfo="label+percent",
-            textfont=dict(size=13, color=pal["text"]),
-            hovertemplate=(
-                "<b>%{label}</b><br>"
-                "Skills: %{value}<br>"
-                "Share: %{percent}<extra></extra>"
-            ),
-        )
-    )
-    fig.update_layout(
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        font=dict(color=pal["font"]),
-        margin=dict(t=30, b=20, l=20, r=20),
-        legend=dict(
-            font=dict(color=pal["legend_text"], size=12),
-            bgcolor="rgba(0,0,0,0)",
-        ),
-        height=380,
-    )
-    return fig
+
+def _donut(
+    labels: list[str],
+    values: list[int],
+    theme: str,
+    value_label: str = "Skills",
+) -> dict:
+    pal = CHART_COLORS[theme]
+    return {
+        "data": [
+            {
+                "type": "pie",
+                "labels": labels,
+                "values": values,
+                "hole": 0.45,
+                "marker": {
+                    "colors": pal["pie_colors"][: len(labels)],
+                    "line": {"color": pal["pie_line"], "width": 2},
+                },
+                "textinfo": "label+percent",
+                "textfont": {"size": 13, "color": pal["text"]},
+                "hovertemplate": (
+                    "<b>%{label}</b><br>"
+                    f"{value_label}: %{{value}}<br>"
+                    "Share: %{percent}<extra></extra>"
+                ),
+            }
+        ],
+        "layout": {
+            "paper_bgcolor": _TRANSPARENT,
+            "plot_bgcolor": _TRANSPARENT,
+            "font": {"color": pal["font"]},
+            "margin": {"t": 30, "b": 20, "l": 20, "r": 20},
+            "legend": {
+                "font": {"color": pal["legend_text"], "size": 12},
+                "bgcolor": _TRANSPARENT,
+            },
+            "height": 380,
+        },
+    }
 
 
 # ---------------------------------------------------------------------------
 # Bar Chart – Skill mention frequencies
 # ---------------------------------------------------------------------------
+@_memoized_figure
 def build_bar_chart(
     frequencies: Counter,
     theme: str = "dark",
-) -> go.Figure:
+    x_title: str = "Mentions",
+    unit: str = "mention(s)",
+    top_n: int = 15,
+) -> dict:
     """Horizontal bar chart of top skill mentions, styled for the active theme."""
     pal = CHART_COLORS[theme]
-    sorted_items = frequencies.most_common(15)
+    sorted_items = Counter(frequencies).most_common(top_n)
     skills = [s for s, _ in reversed(sorted_items)]
     counts = [c for _, c in reversed(sorted_items)]
 
-    fig = go.Figure(
-        go.Bar(
-            x=counts,
-            y=skills,
-            orientation="h",
-            marker=dict(
-                color=counts,
-                colorscale=pal["bar_scale"],
-                line=dict(width=0),
-            ),
-            hovertemplate="<b>%{y}</b>: %{x} mention(s)<extra></extra>",
+    return {
+        "data": [
+            {
+                "type": "bar",
+                "x": counts,
+                "y": skills,
+                "orientation": "h",
+                "marker": {
+                    "color": counts,
+                    "colorscale": pal["bar_scale"],
+                    "line": {"width": 0},
+                },
+                "hovertemplate": f"<b>%{{y}}</b>: %{{x}} {unit}<extra></extra>",
+            }
+        ],
+        "layout": {
+            "paper_bgcolor": _TRANSPARENT,
+            "plot_bgcolor": _TRANSPARENT,
+            "font": {"color": pal["font"], "size": 12},
+            "xaxis": {
+                "title": {"text": x_title},
+                "gridcolor": pal["grid"],
+                "color": pal["axis"],
+            },
+            "yaxis": {"color": pal["yaxis"]},
+            "margin": {"t": 20, "b": 40, "l": 10, "r": 20},
+            "height": max(280, len(skills) * 30 + 60),
+        },
+    }
+
+
+# ---------------------------------------------------------------------------
+# Histogram – Score distribution across the corpus
+# ---------------------------------------------------------------------------
+@_memoized_figure
+def build_histogram_chart(
+    edges: list[float],
+    counts: list[int],
+    theme: str = "dark",
+) -> dict:
+    """Vertical bars over fixed bins (``len(edges) == len(counts) + 1``)."""
+    pal = CHART_COLORS[theme]
+    labels = [f"{lo:g}–{hi:g}" for lo, hi in zip(edges, edges[1:])]
+    counts = list(counts)
+
+    return {
+        "data": [
+            {
+                "type": "bar",
+                "x": labels,
+                "y": counts,
+                "marker": {
+                    "color": counts,
+                    "colorscale": pal["bar_scale"],
+                    "line": {"width": 0},
+                },
+                "hovertemplate": "<b>%{x}%</b>: %{y} resume(s)<extra></extra>",
+            }
+        ],
+        "layout": {
+            "paper_bgcolor": _TRANSPARENT,
+            "plot_bgcolor": _TRANSPARENT,
+            "font": {"color": pal["font"], "size": 12},
+            "xaxis": {"title": {"text": "Strength score (%)"}, "color": pal["axis"]},
+            "yaxis": {
+                "title": {"text": "Resumes"},
+                "gridcolor": pal["grid"],
+                "color": pal["yaxis"],
+            },
+            "margin": {"t": 20, "b": 40, "l": 10, "r": 20},
+            "bargap": 0.1,
+            "height": 320,
+        },
+    }
+
+
+# ---------------------------------------------------------------------------
+# Trend Chart – Weekly volume and mean score
+# ---------------------------------------------------------------------------
+@_memoized_figure
+def build_trend_chart(
+    weeks: list[str],
+    counts: list[int],
+    mean_scores: list[float],
+    theme: str = "dark",
+) -> dict:
+    """Weekly resume volume (bars) with mean score (line, right axis)."""
+    pal = CHART_COLORS[theme]
+
+    return {
+        "data": [
+            {
+                "type": "bar",
+                "x": list(weeks),
+                "y": list(counts),
+                "name": "Resumes",
+                "marker": {"color": pal["pie_colors"][0], "line": {"width": 0}},
+                "hovertemplate": "<b>%{x}</b>: %{y} resume(s)<extra></extra>",
+            },
+            {
+                "type": "scatter",
+                "x": list(weeks),
+                "y": list(mean_scores),
+                "name": "Mean score",
+                "yaxis": "y2",
+                "mode": "lines+markers",
+                "line": {"color": pal["pie_colors"][1], "width": 2},
+                "hovertemplate": "<b>%{x}</b>: %{y}% mean score<extra></extra>",
+            },
+        ],
+        "layout": {
+            "paper_bgcolor": _TRANSPARENT,
+            "plot_bgcolor": _TRANSPARENT,
+            "font": {"color": pal["font"], "size": 12},
+            "xaxis": {"color": pal["axis"]},
+            "yaxis": {
+                "title": {"text": "Resumes"},
+                "gridcolor": pal["grid"],
+                "color": pal["yaxis"],
+            },
+            "yaxis2": {
+                "title": {"text": "Mean score (%)"},
+                "overlaying": "y",
+                "side": "right",
+                "range": [0, 100],
+                "color": pal["yaxis"],
+                "showgrid": False,
+            },
+            "legend": {
+                "font": {"color": pal["legend_text"], "size": 12},
+                "bgcolor": _TRANSPARENT,
+                "orientation": "h",
+            },
+            "margin": {"t": 20, "b": 40, "l": 10, "r": 10},
+            "height": 320,
+        },
+    }
+
+
+# ---------------------------------------------------------------------------
+# Batch static export
+# ---------------------------------------------------------------------------
+_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<script src="plotly.min.js"></script></head>
+<body style="font-family:sans-serif; max-width:960px; margin:auto;">
+<h2>{title}</h2><p>{subtitle}</p>
+{charts}
+</body></html>
+"""
+
+
+def _summary_specs(result: dict, theme: str) -> dict[str, dict]:
+    return {
+        "domains": build_pie_chart.spec(result["detected"], theme),
+        "skills": build_bar_chart.spec(Counter(result["frequencies"]), theme),
+    }
+
+
+def _summary_subtitle(result: dict) -> str:
+    parts = [
+        f"Score {result.get('score', 0)}%",
+        f"{result.get('total_skills', 0)} skills",
+    ]
+    role = result.get("role_info", {}).get("primary")
+    if role:
+        parts.append(role)
+    return " · ".join(parts)
+
+
+def _write_page(path: str, title: str, subtitle: str, body: str) -> None:
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write(
+            _PAGE_TEMPLATE.format(
+                title=html.escape(title), subtitle=html.escape(subtitle), charts=body
+            )
         )
-    )
-    fig.update_layout(
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        font=dict(color=pal["font"], size=12),
-        xaxis=dict(
-            title="Mentions",
-            gridcolor=pal["grid"],
-            color=pal["axis"],
-        ),
-        yaxis=dict(color=pal["yaxis"]),
-        margin=dict(t=20, b=40, l=10, r=20),
-        height=max(280, len(skills) * 30 + 60),
-    )
-    return fig
+
+
+def export_chart_summaries(
+    results,
+    out_dir: str,
+    fmt: str = "html",
+    theme: str = "light",
+) -> list[str]:
+    """
+    Render the domain and skill charts of many results as static files.
+
+    ``fmt="html"`` writes one page per resume plus ``index.html``. All pages
+    share a single ``plotly.min.js`` in ``out_dir``. ``"png"`` and ``"svg"``
+    write one image per chart and need the optional ``kaleido`` package.
+    Results whose ``status`` is not ``"ok"`` are skipped. Returns the paths
+    written.
+    """
+    if fmt not in ("html", "png", "svg"):
+        raise ValueError(f"Unsupported chart export format: {fmt!r}")
+    if fmt != "html":
+        try:
+            import kaleido  # noqa: F401
+        except ImportError:
+            raise ValueError(
+                f"{fmt.upper()} chart export requires the 'kaleido' package."
+            )
+
+    os.makedirs(out_dir, exist_ok=True)
+    written, index = [], []
+    for n, result in enumerate(results):
+        if result.get("status", "ok") != "ok":
+            continue
+        stem = f"{n:05d}_{os.path.splitext(os.path.basename(result['file_name']))[0]}"
+        specs = _summary_specs(result, theme)
+
+        if fmt == "html":
+            charts = "\n".join(
+                pio.to_html(
+                    spec, full_html=False, include_plotlyjs=False, validate=False
+                )
+                for spec in specs.values()
+            )
+            subtitle = _summary_subtitle(result)
+            path = os.path.join(out_dir, f"{stem}.html")
+            _write_page(path, result["file_name"], subtitle, charts)
+            written.append(path)
+            name, subtitle = html.escape(result["file_name"]), html.escape(subtitle)
+            index.append(
+                f"<li><a href='{quote(stem)}.html'>{name}</a> — {subtitle}</li>"
+            )
+        else:
+            for chart, spec in specs.items():
+                path = os.path.join(out_dir, f"{stem}_{chart}.{fmt}")
+                pio.write_image(spec, path, format=fmt, validate=False)
+                written.append(path)
+
+    if fmt == "html":
+        with open(os.path.join(out_dir, "plotly.min.js"), "w", encoding="utf-8") as fh:
+            fh.write(get_plotlyjs())
+        path = os.path.join(out_dir, "index.html")
+        body = "<ul>\n" + "\n".join(index) + "\n</ul>"
+        _write_page(path, "Resume chart summaries", f"{len(index)} resume(s)", body)
+        written.append(path)
+    return written
@@ -0,0 +1,203 @@
+"""
+corpus — Mergeable streaming aggregates over every analyzed resume.
+
+Each structure updates in O(1) per resume (independent of corpus size) and
+merges cheaply, so parallel workers can build partial aggregates and
+combine them instead of recomputing from scratch.
+"""
+
+import hashlib
+import math
+import threading
+from collections import Counter
+from datetime import date, datetime
+
+from utils.analyzer import preprocess_text
+
+SCORE_BIN_WIDTH = 5.0
+
+
+def _hash64(key: str) -> int:
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+# ---------------------------------------------------------------------------
+# Sketches
+# ---------------------------------------------------------------------------
+class CountMinSketch:
+    """Approximate term counts in fixed memory; never under-estimates."""
+
+    def __init__(self, width: int = 2048, depth: int = 4):
+        if not 1 <= depth <= 8:
+            raise ValueError("depth must be between 1 and 8.")
+        self.width = width
+        self.depth = depth
+        self.table = [[0] * width for _ in range(depth)]
+
+    def _cells(self, key: str):
+        # One digest supplies an independent 64-bit hash per row
+        digest = hashlib.blake2b(
+            key.encode("utf-8"), digest_size=8 * self.depth
+        ).digest()
+        for row in range(self.depth):
+            chunk = digest[8 * row: 8 * row + 8]
+            yield row, int.from_bytes(chunk, "big") % self.width
+
+    def add(self, key: str, count: int = 1) -> None:
+        for row, col in self._cells(key):
+            self.table[row][col] += count
+
+    def estimate(self, key: str) -> int:
+        return min(self.table[row][col] for row, col in self._cells(key))
+
+    def merge(self, other: "CountMinSketch") -> "CountMinSketch":
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Cannot merge sketches of different dimensions.")
+        for mine, theirs in zip(self.table, other.table):
+            for col, value in enumerate(theirs):
+                mine[col] += value
+        return self
+
+
+class HyperLogLog:
+    """Approximate distinct count (~1.6% error at the default precision)."""
+
+    def __init__(self, precision: int = 12):
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, key: str) -> None:
+        h = _hash64(key)
+        index = h >> (64 - self.precision)
+        rest = (h << self.precision) & ((1 << 64) - 1)
+        rank = 64 - self.precision + 1 if rest == 0 else 65 - rest.bit_length()
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def estimate(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            raw = m * math.log(m / zeros)  # small-range correction
+        return round(raw)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if self.precision != other.precision:
+            raise ValueError("Cannot merge HyperLogLogs of different precision.")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+
+class Histogram:
+    """Fixed-bin histogram over ``[low, high]``; out-of-range values clamp."""
+
+    def __init__(
+        self, low: float = 0.0, high: float = 100.0, width: float = SCORE_BIN_WIDTH
+    ):
+        self.low = low
+        self.width = width
+        self.counts = [0] * math.ceil((high - low) / width)
+
+    @property
+    def edges(self) -> list[float]:
+        return [self.low + i * self.width for i in range(len(self.counts) + 1)]
+
+    def add(self, value: float) -> None:
+        index = int((value - self.low) // self.width)
+        self.counts[min(max(index, 0), len(self.counts) - 1)] += 1
+
+    def merge(self, other: "Histogram") -> "Histogram":
+        if (self.low, self.width, len(self.counts)) != (
+            other.low, other.width, len(other.counts)
+        ):
+            raise ValueError("Cannot merge histograms with different bins.")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        return self
+
+
+# ---------------------------------------------------------------------------
+# Corpus aggregate
+# ---------------------------------------------------------------------------
+class CorpusStats:
+    """
+    Running aggregates over analyzed resumes.
+
+    Feed it the dicts produced by ``utils.batch.analyze_resume``. Updates and
+    merges are guarded by an internal lock so one instance can be shared by
+    every Streamlit session; the lock is dropped when pickling.
+    """
+
+    def __init__(self):
+        self.resumes = 0
+        self.skill_counts: Counter = Counter()    # resumes mentioning each skill
+        self.domain_counts: Counter = Counter()   # skills detected per domain
+        self.role_counts: Counter = Counter()     # primary role recommendations
+        self.score_hist = Histogram()
+        self.weekly_counts: Counter = Counter()   # ISO week -> resumes
+        self.weekly_scores: Counter = Counter()   # ISO week -> summed score
+        self.term_sketch = CountMinSketch()       # resumes containing each term
+        self.distinct_terms = HyperLogLog()
+        self.distinct_resumes = HyperLogLog()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def update(self, result: dict, when: date | None = None) -> None:
+        """Fold one successful analysis result into the aggregates."""
+        if result.get("status") != "ok":
+            return
+        year, week, _ = (when or datetime.now()).isocalendar()
+        week_key = f"{year}-W{week:02d}"
+        terms = set(preprocess_text(result["raw_text"]).split())
+
+        with self._lock:
+            self.resumes += 1
+            for domain, skills in result["detected"].items():
+                self.domain_counts[domain] += len(skills)
+                self.skill_counts.update(skills)
+            self.role_counts[result["role_info"]["primary"]] += 1
+            self.score_hist.add(result["score"])
+            self.weekly_counts[week_key] += 1
+            self.weekly_scores[week_key] += result["score"]
+            for term in terms:
+                self.term_sketch.add(term)
+                self.distinct_terms.add(term)
+            self.distinct_resumes.add(
+                hashlib.blake2b(result["raw_text"].encode("utf-8")).hexdigest()
+            )
+
+    def merge(self, other: "CorpusStats") -> "CorpusStats":
+        """Fold another partial aggregate (e.g. from a worker) into this one."""
+        with self._lock:
+            self.resumes += other.resumes
+            self.skill_counts.update(other.skill_counts)
+            self.domain_counts.update(other.domain_counts)
+            self.role_counts.update(other.role_counts)
+            self.score_hist.merge(other.score_hist)
+            self.weekly_counts.update(other.weekly_counts)
+            self.weekly_scores.update(other.weekly_scores)
+            self.term_sketch.merge(other.term_sketch)
+            self.distinct_terms.merge(other.distinct_terms)
+            self.distinct_resumes.merge(other.distinct_resumes)
+        return self
+
+    def mean_score(self) -> float:
+        total = sum(self.weekly_scores.values())
+        return round(total / self.resumes, 1) if self.resumes else 0.0
+
+    def weekly_trend(self) -> tuple[list[str], list[int], list[float]]:
+        """Weeks in order with resume counts and mean scores."""
+        weeks = sorted(self.weekly_counts)
+        counts = [self.weekly_counts[w] for w in weeks]
+        means = [round(self.weekly_scores[w] / self.weekly_counts[w], 1) for w in weeks]
+        return weeks, counts, means
@@ -0,0 +1,324 @@
+"""
+export — Chunked columnar export of batch results (NPY / Parquet / CSV).
+
+Rows are buffered into fixed-size row groups and flushed as they fill, so
+memory stays bounded however many resumes are exported. Skills are stored as
+a sparse CSR matrix over ``SKILL_TAXONOMY``: ``skills_indptr`` /
+``skills_indices`` give the skill matrix and ``skills_freq`` holds the
+mention counts on the same sparsity pattern (the frequencies matrix).
+
+The ``npy`` format is a directory of standard ``.npy`` files plus a
+``manifest.json``; ``load_columnar`` memory-maps them, so loading is
+independent of export size.
+"""
+
+import csv
+import io
+import json
+import os
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet export is optional
+    pa = None
+    pq = None
+
+from utils.taxonomy import SKILL_TAXONOMY, SKILL_INDEX
+
+FORMATS = ("npy", "parquet", "csv")
+DEFAULT_ROW_GROUP_SIZE = 65_536
+MANIFEST_NAME = "manifest.json"
+
+# Column name -> dtype for the npy format
+_NPY_COLUMNS = {
+    "doc_id_offsets": np.int64,
+    "doc_id_data": np.uint8,
+    "score": np.float32,
+    "role": np.int32,
+    "dominant_domain": np.int16,
+    "skills_indptr": np.int64,
+    "skills_indices": np.int32,
+    "skills_freq": np.int32,
+}
+
+
+def _npy_header(dtype, length: int) -> bytes:
+    """A version 1.0 ``.npy`` header for a 1-D array of ``length`` items."""
+    buffer = io.BytesIO()
+    np.lib.format.write_array_header_1_0(
+        buffer,
+        {
+            "descr": np.lib.format.dtype_to_descr(np.dtype(dtype)),
+            "fortran_order": False,
+            "shape": (length,),
+        },
+    )
+    return buffer.getvalue()
+
+
+# ---------------------------------------------------------------------------
+# Writer
+# ---------------------------------------------------------------------------
+class ColumnarWriter:
+    """
+    Stream analysis results into a columnar file or directory.
+
+    Only successful results (``status == "ok"``) are written. Use as a
+    context manager, or call ``close()`` to flush the final row group.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fmt: str = "npy",
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown export format {fmt!r}; choose from {FORMATS}.")
+        if fmt == "parquet" and pq is None:
+            raise ValueError("Parquet export requires the 'pyarrow' package.")
+        self.path = path
+        self.fmt = fmt
+        self.row_group_size = row_group_size
+        self.rows = 0
+        self.row_groups = 0
+        self._roles: dict[str, int] = {}
+        self._domains: dict[str, int] = {}
+        self._buffer: list[dict] = []
+        self._nnz = 0
+        self._doc_bytes = 0
+        self.manifest: dict | None = None
+        self._open()
+
+    # -- lifecycle ----------------------------------------------------------
+    def _open(self) -> None:
+        if self.fmt == "npy":
+            os.makedirs(self.path, exist_ok=True)
+            self._files = {}
+            for name, dtype in _NPY_COLUMNS.items():
+                fh = open(os.path.join(self.path, f"{name}.npy"), "wb")
+                fh.write(_npy_header(dtype, 0))
+                self._files[name] = fh
+            # CSR-style offset columns start with a leading zero
+            np.zeros(1, np.int64).tofile(self._files["doc_id_offsets"])
+            np.zeros(1, np.int64).tofile(self._files["skills_indptr"])
+        elif self.fmt == "parquet":
+            self._schema = pa.schema(
+                [
+                    ("doc_id", pa.string()),
+                    ("score", pa.float32()),
+                    ("role", pa.dictionary(pa.int32(), pa.string())),
+                    ("dominant_domain", pa.dictionary(pa.int16(), pa.string())),
+                    ("skills", pa.list_(pa.int32())),
+                    ("skills_freq", pa.list_(pa.int32())),
+                ],
+                metadata={"skill_taxonomy": json.dumps(SKILL_TAXONOMY)},
+            )
+            self._parquet = pq.ParquetWriter(self.path, self._schema)
+        else:
+            self._csv_fh = open(self.path, "w", newline="", encoding="utf-8")
+            self._csv = csv.writer(self._csv_fh)
+            self._csv.writerow(
+                ["doc_id", "score", "role", "dominant_domain", "skills", "skills_freq"]
+            )
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def write(self, result: dict) -> None:
+        """Buffer one result; flushes a row group once the buffer is full."""
+        if result.get("status") != "ok":
+            return
+        self._buffer.append(result)
+        if len(self._buffer) >= self.row_group_size:
+            self._flush()
+
+    def write_many(self, results) -> None:
+        for result in results:
+            self.write(result)
+
+    def close(self) -> dict:
+        """Flush remaining rows, finalize headers and return the manifest."""
+        if self.manifest is not None:
+            return self.manifest
+        self._flush()
+        manifest = {
+            "format": self.fmt,
+            "rows": self.rows,
+            "row_groups": self.row_groups,
+            "row_group_size": self.row_group_size,
+            "skill_vocab": SKILL_TAXONOMY,
+            "role_vocab": list(self._roles),
+            "domain_vocab": list(self._domains),
+        }
+        if self.fmt == "npy":
+            lengths = {
+                "doc_id_offsets": self.rows + 1,
+                "doc_id_data": self._doc_bytes,
+                "score": self.rows,
+                "role": self.rows,
+                "dominant_domain": self.rows,
+                "skills_indptr": self.rows + 1,
+                "skills_indices": self._nnz,
+                "skills_freq": self._nnz,
+            }
+            for name, fh in self._files.items():
+                fh.seek(0)
+                fh.write(_npy_header(_NPY_COLUMNS[name], lengths[name]))
+                fh.close()
+            with open(os.path.join(self.path, MANIFEST_NAME), "w") as fh:
+                json.dump(manifest, fh)
+        elif self.fmt == "parquet":
+            self._parquet.close()
+        else:
+            self._csv_fh.close()
+        self.manifest = manifest
+        return manifest
+
+    # -- row groups ---------------------------------------------------------
+    def _code(self, vocab: dict[str, int], value: str) -> int:
+        return vocab.setdefault(value, len(vocab))
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+
+        doc_ids = [r["file_name"] for r in batch]
+        scores = np.fromiter((r["score"] for r in batch), np.float32, len(batch))
+        roles = [r["role_info"]["primary"] for r in batch]
+        domains = [r["role_info"]["dominant_domain"] for r in batch]
+        skill_rows = []
+        freq_rows = []
+        for r in batch:
+            # Column indices sorted within each row, as CSR consumers expect
+            row = sorted(
+                (SKILL_INDEX[s], r["frequencies"].get(s, 0))
+                for skills in r["detected"].values()
+                for s in skills
+            )
+            skill_rows.append([i for i, _ in row])
+            freq_rows.append([f for _, f in row])
+
+        if self.fmt == "npy":
+            self._flush_npy(doc_ids, scores, roles, domains, skill_rows, freq_rows)
+        elif self.fmt == "parquet":
+            self._flush_parquet(doc_ids, scores, roles, domains, skill_rows, freq_rows)
+        else:
+            for doc_id, score, role, domain, skills, freqs in zip(
+                doc_ids, scores, roles, domains, skill_rows, freq_rows
+            ):
+                self._csv.writerow(
+                    [
+                        doc_id,
+                        f"{score:g}",
+                        role,
+                        domain,
+                        ";".join(SKILL_TAXONOMY[i] for i in skills),
+                        ";".join(map(str, freqs)),
+                    ]
+                )
+
+        self.rows += len(batch)
+        self.row_groups += 1
+
+    def _flush_npy(self, doc_ids, scores, roles, domains, skill_rows, freq_rows):
+        files = self._files
+        encoded = [d.encode("utf-8") for d in doc_ids]
+        lengths = np.fromiter(map(len, encoded), np.int64, len(encoded))
+        (self._doc_bytes + np.cumsum(lengths)).tofile(files["doc_id_offsets"])
+        np.frombuffer(b"".join(encoded), np.uint8).tofile(files["doc_id_data"])
+        self._doc_bytes += int(lengths.sum())
+
+        scores.tofile(files["score"])
+        np.array([self._code(self._roles, r) for r in roles], np.int32).tofile(
+            files["role"]
+        )
+        np.array([self._code(self._domains, d) for d in domains], np.int16).tofile(
+            files["dominant_domain"]
+        )
+
+        counts = np.fromiter(map(len, skill_rows), np.int64, len(skill_rows))
+        (self._nnz + np.cumsum(counts)).tofile(files["skills_indptr"])
+        np.array([i for row in skill_rows for i in row], np.int32).tofile(
+            files["skills_indices"]
+        )
+        np.array([f for row in freq_rows for f in row], np.int32).tofile(
+            files["skills_freq"]
+        )
+        self._nnz += int(counts.sum())
+
+    def _flush_parquet(self, doc_ids, scores, roles, domains, skill_rows, freq_rows):
+        table = pa.table(
+            {
+                "doc_id": pa.array(doc_ids, pa.string()),
+                "score": pa.array(scores, pa.float32()),
+                "role": pa.array(roles).dictionary_encode().cast(
+                    self._schema.field("role").type
+                ),
+                "dominant_domain": pa.array(domains).dictionary_encode().cast(
+                    self._schema.field("dominant_domain").type
+                ),
+                "skills": pa.array(skill_rows, pa.list_(pa.int32())),
+                "skills_freq": pa.array(freq_rows, pa.list_(pa.int32())),
+            },
+            schema=self._schema,
+        )
+        for role in roles:
+            self._code(self._roles, role)
+        for domain in domains:
+            self._code(self._domains, domain)
+        self._parquet.write_table(table, row_group_size=len(doc_ids))
+
+
+def export_results(
+    results,
+    path: str,
+    fmt: str = "npy",
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> dict:
+    """Write an iterable of analysis results and return the manifest."""
+    with ColumnarWriter(path, fmt=fmt, row_group_size=row_group_size) as writer:
+        writer.write_many(results)
+    return writer.manifest
+
+
+# ---------------------------------------------------------------------------
+# Loader
+# ---------------------------------------------------------------------------
+def load_columnar(path: str) -> dict:
+    """
+    Load an export without reading it into memory.
+
+    For an ``npy`` directory, returns the manifest fields plus one read-only
+    memory-mapped array per column; decode a document id with
+    ``doc_id_at(data, i)``. A Parquet file is opened memory-mapped and
+    returned as a ``pyarrow.Table`` under ``"table"``.
+    """
+    if os.path.isfile(path):
+        if pq is None:
+            raise ValueError("Loading Parquet exports requires the 'pyarrow' package.")
+        table = pq.read_table(path, memory_map=True)
+        return {
+            "format": "parquet",
+            "rows": table.num_rows,
+            "skill_vocab": json.loads(table.schema.metadata[b"skill_taxonomy"]),
+            "table": table,
+        }
+
+    with open(os.path.join(path, MANIFEST_NAME)) as fh:
+        data = json.load(fh)
+    for name in _NPY_COLUMNS:
+        data[name] = np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+    return data
+
+
+def doc_id_at(data: dict, row: int) -> str:
+    start, end = data["doc_id_offsets"][row], data["doc_id_offsets"][row + 1]
+    return bytes(data["doc_id_data"][start:end]).decode("utf-8")
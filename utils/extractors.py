@@ -0,0 +1,291 @@
+"""
+extractors — Pluggable text-extraction backends with content sniffing.
+
+Every format (``pdf``, ``docx``, ``txt``) has a registry of backends. Each
+backend is a plain function ``(data: bytes) -> str``. Optional parsers
+register themselves only when their package is installed. The format is
+sniffed from the leading bytes, and the file extension is used only when
+the content is inconclusive. Backends run in order: first the calibrated
+order from ``EXTRACTOR_SELECTION_PATH`` (see
+``scripts/calibrate_extractors.py``), then registration order. A backend
+whose text scores below ``EXTRACTOR_MIN_QUALITY`` (empty or garbled) falls
+through to the next one.
+"""
+
+import io
+import json
+import os
+import threading
+import zipfile
+from typing import Callable
+from xml.etree import ElementTree
+
+import PyPDF2
+import docx
+
+from config.settings import (
+    EXTRACTOR_SELECTION_PATH,
+    EXTRACTOR_FALLBACK,
+    EXTRACTOR_MIN_QUALITY,
+)
+
+try:
+    import pypdf
+except ImportError:  # optional PDF backend
+    pypdf = None
+
+try:
+    from pdfminer.high_level import extract_text as _pdfminer_extract_text
+except ImportError:  # optional PDF backend
+    _pdfminer_extract_text = None
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:  # optional PDF backend
+    fitz = None
+
+FORMATS = ("pdf", "docx", "txt")
+UNSUPPORTED_MESSAGE = "Unsupported file format. Please upload a PDF, DOCX, or TXT file."
+
+_BACKENDS: dict[str, dict[str, Callable[[bytes], str]]] = {fmt: {} for fmt in FORMATS}
+_order_cache: dict[str, list[str]] = {}
+_order_lock = threading.Lock()
+
+
+def register(fmt: str, name: str):
+    """Decorator adding a ``(data: bytes) -> str`` backend for ``fmt``."""
+    def decorator(func: Callable[[bytes], str]) -> Callable[[bytes], str]:
+        _BACKENDS[fmt][name] = func
+        _order_cache.pop(fmt, None)
+        return func
+    return decorator
+
+
+def available_backends(fmt: str) -> list[str]:
+    """Installed backends for ``fmt``, in registration order."""
+    return list(_BACKENDS.get(fmt, ()))
+
+
+def get_backend(fmt: str, name: str) -> Callable[[bytes], str]:
+    return _BACKENDS[fmt][name]
+
+
+# ---------------------------------------------------------------------------
+# Content sniffing
+# ---------------------------------------------------------------------------
+_EXTENSION_FORMATS = {".pdf": "pdf", ".docx": "docx", ".txt": "txt"}
+_SNIFF_BYTES = 8192
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def _looks_like_text(head: bytes) -> bool:
+    if head.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return True
+    if b"\x00" in head:
+        return False
+    controls = sum(1 for b in head if b < 32 and b not in (9, 10, 12, 13))
+    return controls <= len(head) * 0.02
+
+
+def sniff_format(data: bytes, name: str = "") -> str | None:
+    """
+    Format of a document from its magic bytes, falling back to the extension.
+
+    Returns ``"pdf"``, ``"docx"``, ``"txt"`` or None when unsupported.
+    """
+    head = data[:_SNIFF_BYTES]
+    # Only a BOM or whitespace may precede the header; text that merely
+    # mentions "%PDF-" must not be routed to the PDF parsers
+    if head.removeprefix(_UTF8_BOM).lstrip().startswith(b"%PDF-"):
+        return "pdf"
+    if head.startswith(b"PK\x03\x04"):
+        try:
+            with zipfile.ZipFile(io.BytesIO(data)) as zf:
+                if "word/document.xml" in zf.namelist():
+                    return "docx"
+        except zipfile.BadZipFile:
+            pass
+    elif head and _looks_like_text(head):
+        return "txt"
+    return _EXTENSION_FORMATS.get(os.path.splitext(name.lower())[1])
+
+
+# ---------------------------------------------------------------------------
+# Text quality
+# ---------------------------------------------------------------------------
+_QUALITY_SAMPLE_CHARS = 20_000
+_PUNCTUATION = ".,;:!?()[]{}<>\"'`*•|/"
+
+
+def text_quality(text: str) -> float:
+    """
+    Heuristic 0–1 readability score for extracted text.
+
+    It is the share of tokens that look like words, scaled by the share of
+    printable characters. Unicode replacement characters and PDF ``(cid:N)``
+    glyph placeholders count against it. Empty text scores 0. Glued words
+    (missing spaces) and symbol soup both score low.
+    """
+    sample = text[:_QUALITY_SAMPLE_CHARS]
+    tokens = sample.split()
+    if not tokens:
+        return 0.0
+    wordlike = 0
+    for token in tokens:
+        token = token.strip(_PUNCTUATION)
+        letters = sum(c.isalpha() for c in token)
+        if token and len(token) <= 30 and letters * 2 >= len(token):
+            wordlike += 1
+    bad = sample.count("�") + sample.count("(cid:")
+    printable = sum(c.isprintable() or c.isspace() for c in sample) - bad
+    return (wordlike / len(tokens)) * max(printable, 0) / len(sample)
+
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+@register("pdf", "pypdf2")
+def _pdf_pypdf2(data: bytes) -> str:
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+if pypdf is not None:
+    @register("pdf", "pypdf")
+    def _pdf_pypdf(data: bytes) -> str:
+        reader = pypdf.PdfReader(io.BytesIO(data))
+        return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+if _pdfminer_extract_text is not None:
+    @register("pdf", "pdfminer")
+    def _pdf_pdfminer(data: bytes) -> str:
+        return _pdfminer_extract_text(io.BytesIO(data))
+
+
+if fitz is not None:
+    @register("pdf", "pymupdf")
+    def _pdf_pymupdf(data: bytes) -> str:
+        with fitz.open(stream=data, filetype="pdf") as doc:
+            return "\n".join(page.get_text() for page in doc)
+
+
+@register("docx", "python-docx")
+def _docx_python_docx(data: bytes) -> str:
+    doc = docx.Document(io.BytesIO(data))
+    return "\n".join(paragraph.text for paragraph in doc.paragraphs)
+
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+@register("docx", "docx-xml")
+def _docx_xml(data: bytes) -> str:
+    """Paragraph text read straight from ``word/document.xml``, tables included."""
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        root = ElementTree.fromstring(zf.read("word/document.xml"))
+    paragraphs = []
+    for paragraph in root.iter(f"{_W}p"):
+        parts = []
+        for node in paragraph.iter():
+            if node.tag == f"{_W}t":
+                parts.append(node.text or "")
+            elif node.tag == f"{_W}tab":
+                parts.append("\t")
+            elif node.tag in (f"{_W}br", f"{_W}cr"):
+                parts.append("\n")
+        paragraphs.append("".join(parts))
+    return "\n".join(paragraphs)
+
+
+@register("txt", "utf-8")
+def _txt_utf8(data: bytes) -> str:
+    return data.decode("utf-8", errors="ignore")
+
+
+@register("txt", "charset")
+def _txt_charset(data: bytes) -> str:
+    """BOM-aware decoding with a Windows-1252 fallback for legacy files."""
+    if data.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return data.decode("utf-16", errors="replace")
+    try:
+        return data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return data.decode("cp1252", errors="replace")
+
+
+# ---------------------------------------------------------------------------
+# Selection
+# ---------------------------------------------------------------------------
+def load_selection(path: str | None = EXTRACTOR_SELECTION_PATH) -> dict[str, list[str]]:
+    """Calibrated ``{format: [backend, ...]}`` order, or {} when absent."""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh).get("selection", {})
+
+
+def backend_order(fmt: str) -> list[str]:
+    """
+    Backends to try for ``fmt``: calibrated ones first, then the rest.
+
+    Calibrated names that are not installed here are skipped, so one
+    selection file can be shared across deployments.
+    """
+    with _order_lock:
+        if fmt not in _order_cache:
+            installed = available_backends(fmt)
+            chosen = [b for b in load_selection().get(fmt, []) if b in installed]
+            _order_cache[fmt] = chosen + [b for b in installed if b not in chosen]
+        return _order_cache[fmt]
+
+
+def reload_selection() -> None:
+    """Forget cached orders so the next extraction re-reads the selection."""
+    with _order_lock:
+        _order_cache.clear()
+
+
+# ---------------------------------------------------------------------------
+# Extraction
+# ---------------------------------------------------------------------------
+def extract(
+    data: bytes,
+    name: str = "",
+    fallback: bool = EXTRACTOR_FALLBACK,
+    min_quality: float = EXTRACTOR_MIN_QUALITY,
+) -> str:
+    """
+    Extract text from one document given as bytes.
+
+    Returns the first backend's text that reaches ``min_quality``. Without
+    one, returns the best-scoring text produced. Raises ``ValueError`` for
+    unsupported content, and re-raises the first backend error if every
+    backend failed.
+    """
+    fmt = sniff_format(data, name)
+    if fmt is None:
+        raise ValueError(UNSUPPORTED_MESSAGE)
+
+    best, best_quality, error = None, -1.0, None
+    for backend in backend_order(fmt):
+        try:
+            text = _BACKENDS[fmt][backend](data)
+        except MemoryError:
+            raise
+        except Exception as exc:
+            error = error or exc
+            if not fallback:
+                break
+            continue
+        quality = text_quality(text)
+        if quality >= min_quality:
+            return text
+        if quality > best_quality:
+            best, best_quality = text, quality
+        if not fallback:
+            break
+
+    if best is None:
+        raise error or ValueError(f"No {fmt.upper()} extractor is available.")
+    return best
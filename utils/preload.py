@@ -0,0 +1,23 @@
+"""
+preload — Warm, read-only state shared by every worker process.
+
+The forkserver imports this module once, before it forks any worker (see
+``utils.workers.worker_context``). The parsers, compiled skill patterns,
+skill taxonomy, role matrix and extractor order are therefore built a
+single time, and every child shares those pages copy-on-write.
+``gc.freeze()`` then moves the objects out of the collector's reach, so
+collections in a child do not write to the shared pages and force a copy.
+"""
+
+import gc
+
+import utils.batch  # noqa: F401  (parsers, analyzer patterns, taxonomy)
+from utils.extractors import FORMATS, backend_order
+from utils.roles import get_default_engine
+
+get_default_engine()
+for _fmt in FORMATS:
+    backend_order(_fmt)
+
+gc.collect()
+gc.freeze()
@@ -0,0 +1,171 @@
+"""
+profiles — Bitset skill profiles for gap analysis and candidate similarity.
+
+A profile is a Python int with bit ``i`` set when the resume has skill
+``SKILL_TAXONOMY[i]``. Gap analysis, overlap and Jaccard similarity are
+then single bitwise operations plus a popcount. ``SkillIndex`` keeps the
+profiles of a whole corpus as a NumPy ``uint64`` matrix, so "most similar
+candidates" is one vectorized AND/OR + popcount pass over every row.
+"""
+
+import threading
+
+import numpy as np
+
+from utils.roles import RoleEngine, get_default_engine
+from utils.taxonomy import SKILL_TAXONOMY, SKILL_INDEX
+
+WORDS = (len(SKILL_TAXONOMY) + 63) // 64
+REQUIRED_RELATIVE_WEIGHT = 0.5   # share of a role's top weight deemed "required"
+
+if hasattr(np, "bitwise_count"):
+    _popcount = np.bitwise_count
+else:  # NumPy < 2.0
+    _POPCOUNT_LUT = np.array([bin(i).count("1") for i in range(256)], np.uint8)
+
+    def _popcount(words: np.ndarray) -> np.ndarray:
+        as_bytes = words.view(np.uint8).reshape(*words.shape, 8)
+        return _POPCOUNT_LUT[as_bytes].sum(axis=-1, dtype=np.uint64)
+
+
+# ---------------------------------------------------------------------------
+# Single profiles
+# ---------------------------------------------------------------------------
+def skill_bitset(detected_skills: dict[str, list[str]]) -> int:
+    """Bitset of the detected skills over ``SKILL_TAXONOMY``."""
+    bits = 0
+    for skills in detected_skills.values():
+        for skill in skills:
+            if skill in SKILL_INDEX:
+                bits |= 1 << SKILL_INDEX[skill]
+    return bits
+
+
+def bitset_skills(bits: int) -> list[str]:
+    """Skill names set in ``bits``, in taxonomy order."""
+    names = []
+    while bits:
+        low = bits & -bits
+        names.append(SKILL_TAXONOMY[low.bit_length() - 1])
+        bits ^= low
+    return names
+
+
+def overlap(a: int, b: int) -> int:
+    return (a & b).bit_count()
+
+
+def jaccard(a: int, b: int) -> float:
+    union = (a | b).bit_count()
+    return (a & b).bit_count() / union if union else 0.0
+
+
+def to_words(bits: int) -> np.ndarray:
+    """Split a profile into ``WORDS`` little-endian ``uint64`` words."""
+    return np.array(
+        [(bits >> (64 * w)) & 0xFFFF_FFFF_FFFF_FFFF for w in range(WORDS)], np.uint64
+    )
+
+
+# ---------------------------------------------------------------------------
+# Gap analysis
+# ---------------------------------------------------------------------------
+_required_cache: dict[tuple[int, str, float], int] = {}
+
+
+def required_bitset(
+    role: str,
+    engine: RoleEngine | None = None,
+    min_relative_weight: float = REQUIRED_RELATIVE_WEIGHT,
+) -> int:
+    """
+    Skills a role requires: those weighted at least ``min_relative_weight``
+    of the role's strongest skill in the role matrix.
+    """
+    engine = engine or get_default_engine()
+    key = (id(engine), role, min_relative_weight)
+    if key not in _required_cache:
+        r = engine.roles.index(role)
+        cols = np.repeat(np.arange(len(engine.skills)), np.diff(engine.indptr))
+        mine = engine.role_ids == r
+        weights = engine.weights[mine]
+        chosen = cols[mine][weights >= min_relative_weight * weights.max()]
+        bits = 0
+        for col in chosen:
+            bits |= 1 << int(col)
+        _required_cache[key] = bits
+    return _required_cache[key]
+
+
+def skill_gap(profile: int, role: str, engine: RoleEngine | None = None) -> dict:
+    """Required skills for ``role`` that the profile has and lacks."""
+    required = required_bitset(role, engine)
+    return {
+        "role": role,
+        "required": required.bit_count(),
+        "covered": bitset_skills(required & profile),
+        "missing": bitset_skills(required & ~profile),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Corpus index
+# ---------------------------------------------------------------------------
+class SkillIndex:
+    """
+    Corpus-wide matrix of skill profiles for similarity search.
+
+    Rows are keyed by document id; re-adding an id overwrites its row.
+    Storage grows by doubling, so adds are amortized O(1).
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._matrix = np.zeros((capacity, WORDS), np.uint64)
+        self._ids: list[str] = []
+        self._labels: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, doc_id: str, profile: int, label: str = "") -> None:
+        words = to_words(profile)
+        with self._lock:
+            row = self._rows.get(doc_id)
+            if row is None:
+                row = len(self._ids)
+                if row == len(self._matrix):
+                    grown = np.zeros((2 * len(self._matrix), WORDS), np.uint64)
+                    grown[:row] = self._matrix
+                    self._matrix = grown
+                self._rows[doc_id] = row
+                self._ids.append(doc_id)
+                self._labels.append(label or doc_id)
+            self._matrix[row] = words
+            self._labels[row] = label or doc_id
+
+    def most_similar(
+        self, profile: int, k: int = 20, exclude: str | None = None
+    ) -> list[tuple[str, str, float]]:
+        """Top ``k`` ``(doc_id, label, jaccard)`` by Jaccard similarity."""
+        query = to_words(profile)
+        with self._lock:
+            n = len(self._ids)
+            matrix = self._matrix[:n]
+            ids, labels = self._ids, self._labels
+            skip = self._rows.get(exclude) if exclude is not None else None
+            inter = _popcount(matrix & query).sum(axis=1, dtype=np.int64)
+            union = _popcount(matrix | query).sum(axis=1, dtype=np.int64)
+
+        scores = np.divide(inter, union, out=np.zeros(n), where=union > 0)
+        if skip is not None:
+            scores[skip] = -1.0
+        k = min(k, n)
+        if k <= 0:
+            return []
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [
+            (ids[i], labels[i], float(scores[i])) for i in best if scores[i] > 0
+        ]
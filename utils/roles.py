@@ -0,0 +1,161 @@
+"""
+roles — Matrix-based role recommendation over a role × skill weight matrix.
+
+The weight matrix is stored sparse and column-major (one slice of role ids
+and weights per skill). Scoring a resume is then one sparse matrix-vector
+product that touches only the columns of the skills it contains. Scoring a
+batch is one sparse matrix-matrix product over the same CSR layout that
+``utils.export`` writes. Scores are cosine similarities between the resume's
+binary skill vector and each L2-normalized role row.
+"""
+
+import json
+import threading
+
+import numpy as np
+
+from config.settings import ROLE_WEIGHTS_PATH, ROLE_TOP_K
+from config.skills_db import ROLE_SKILL_WEIGHTS
+from utils.taxonomy import SKILL_TAXONOMY, SKILL_INDEX, display_name
+
+
+def _gather(indptr: np.ndarray, columns: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Positions of all entries in ``columns`` of a CSC matrix, plus run lengths."""
+    starts = indptr[columns]
+    lengths = indptr[columns + 1] - starts
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(int(lengths.sum())), lengths
+
+
+class RoleEngine:
+    """Role affinities as sparse products against a role × skill matrix."""
+
+    def __init__(
+        self,
+        roles: list[str],
+        indptr: np.ndarray,
+        role_ids: np.ndarray,
+        weights: np.ndarray,
+        skills: list[str] = SKILL_TAXONOMY,
+    ):
+        self.roles = roles
+        self.skills = skills
+        self.skill_index = {name: i for i, name in enumerate(skills)}
+        self.indptr = indptr        # len(skills) + 1
+        self.role_ids = role_ids    # role of each stored weight
+        self.weights = weights      # row-normalized weights
+
+    # -- construction -------------------------------------------------------
+    @classmethod
+    def from_weights(
+        cls,
+        role_weights: dict[str, dict[str, float]],
+        skills: list[str] = SKILL_TAXONOMY,
+    ) -> "RoleEngine":
+        """
+        Build from ``{role: {skill: weight}}``.
+
+        Skills may be given as ``SKILLS_DB`` search terms or display names;
+        terms sharing a display name keep the larger weight.
+        """
+        index = SKILL_INDEX if skills is SKILL_TAXONOMY else {
+            name: i for i, name in enumerate(skills)
+        }
+        roles = list(role_weights)
+        cells: dict[tuple[int, int], float] = {}
+        for r, role in enumerate(roles):
+            for skill, weight in role_weights[role].items():
+                col = index.get(skill, index.get(display_name(skill)))
+                if col is None:
+                    raise ValueError(f"Unknown skill {skill!r} in role {role!r}.")
+                cells[(col, r)] = max(cells.get((col, r), 0.0), float(weight))
+
+        cols = np.fromiter((c for c, _ in cells), np.int64, len(cells))
+        role_ids = np.fromiter((r for _, r in cells), np.int32, len(cells))
+        weights = np.fromiter(cells.values(), np.float64, len(cells))
+
+        norms = np.sqrt(np.bincount(role_ids, weights=weights**2, minlength=len(roles)))
+        weights = weights / np.where(norms > 0, norms, 1.0)[role_ids]
+
+        order = np.lexsort((role_ids, cols))
+        indptr = np.zeros(len(skills) + 1, np.int64)
+        np.cumsum(np.bincount(cols, minlength=len(skills)), out=indptr[1:])
+        return cls(
+            roles, indptr, role_ids[order], weights[order].astype(np.float32), skills
+        )
+
+    @classmethod
+    def from_json(cls, path: str) -> "RoleEngine":
+        """Load ``{role: {skill: weight}}`` from a JSON file."""
+        with open(path, encoding="utf-8") as fh:
+            return cls.from_weights(json.load(fh))
+
+    # -- scoring ------------------------------------------------------------
+    def skill_ids(self, detected_skills: dict[str, list[str]]) -> np.ndarray:
+        names = {s for skills in detected_skills.values() for s in skills}
+        return np.fromiter(
+            (self.skill_index[s] for s in names if s in self.skill_index), np.int64
+        )
+
+    def affinities(self, skill_ids: np.ndarray) -> np.ndarray:
+        """Cosine affinity of one resume (given by skill ids) to every role."""
+        skill_ids = np.asarray(skill_ids, np.int64)
+        scores = np.zeros(len(self.roles))
+        if skill_ids.size:
+            pos, _ = _gather(self.indptr, skill_ids)
+            scores = np.bincount(
+                self.role_ids[pos], weights=self.weights[pos], minlength=len(self.roles)
+            )
+            scores /= np.sqrt(skill_ids.size)
+        return scores
+
+    def affinities_batch(self, indptr: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        """
+        Affinities for many resumes given as CSR (``indptr``, ``indices``).
+
+        Returns an ``(n_resumes, n_roles)`` array; pass row ranges of a large
+        export in chunks to bound memory.
+        """
+        indptr = np.asarray(indptr, np.int64)
+        indices = np.asarray(indices, np.int64)
+        n = len(indptr) - 1
+        n_roles = len(self.roles)
+        row_sizes = np.diff(indptr)
+        rows = np.repeat(np.arange(n), row_sizes)
+        pos, lengths = _gather(self.indptr, indices)
+        flat = np.repeat(rows, lengths) * n_roles + self.role_ids[pos]
+        scores = np.bincount(
+            flat, weights=self.weights[pos], minlength=n * n_roles
+        ).reshape(n, n_roles)
+        return scores / np.sqrt(np.maximum(row_sizes, 1))[:, None]
+
+    def top_k(self, scores: np.ndarray, k: int = ROLE_TOP_K) -> list[tuple[str, float]]:
+        """The ``k`` best roles with scores, best first (zero scores dropped)."""
+        k = min(k, len(scores))
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(self.roles[i], float(scores[i])) for i in best if scores[i] > 0]
+
+    def recommend(
+        self, detected_skills: dict[str, list[str]], k: int = ROLE_TOP_K
+    ) -> list[tuple[str, float]]:
+        return self.top_k(self.affinities(self.skill_ids(detected_skills)), k)
+
+
+# ---------------------------------------------------------------------------
+# Default engine
+# ---------------------------------------------------------------------------
+_default_engine: RoleEngine | None = None
+_default_lock = threading.Lock()
+
+
+def get_default_engine() -> RoleEngine:
+    """Engine built once from ``ROLE_WEIGHTS_PATH`` or ``ROLE_SKILL_WEIGHTS``."""
+    global _default_engine
+    with _default_lock:
+        if _default_engine is None:
+            if ROLE_WEIGHTS_PATH:
+                _default_engine = RoleEngine.from_json(ROLE_WEIGHTS_PATH)
+            else:
+                _default_engine = RoleEngine.from_weights(ROLE_SKILL_WEIGHTS)
+        return _default_engine
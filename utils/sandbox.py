@@ -0,0 +1,256 @@
+"""
+sandbox — Run format parsers in supervised, pooled subprocesses.
+
+A malformed or decompression-bomb document can hang a parser or balloon its
+memory. Here each document is parsed in a reusable worker process that the
+parent watches for wall-clock time, resident memory and output size; any
+breach kills that worker and surfaces an ``ExtractionError`` instead.
+"""
+
+import os
+import threading
+import time
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+from config.settings import (
+    SANDBOX_POOL_SIZE,
+    SANDBOX_TIMEOUT_S,
+    SANDBOX_MAX_RSS_MB,
+    SANDBOX_MAX_TEXT_CHARS,
+)
+from utils.extractors import extract
+from utils.workers import worker_context
+
+_POLL_INTERVAL_S = 0.05
+_STARTUP_TIMEOUT_S = 30.0
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class ExtractionError(ValueError):
+    """
+    Structured extraction failure.
+
+    ``reason`` is one of ``"timeout"``, ``"memory"``, ``"output_limit"``,
+    ``"parse_error"`` or ``"crashed"``.
+    """
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
+
+    def as_dict(self) -> dict:
+        return {"reason": self.reason, "message": str(self)}
+
+
+# ---------------------------------------------------------------------------
+# Worker process
+# ---------------------------------------------------------------------------
+def _address_space_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[0]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _worker_main(conn, max_rss_bytes: int, max_chars: int) -> None:
+    """Serve ``(name, data)`` jobs until the pipe closes or ``None`` arrives."""
+    if resource is not None:
+        # Backstop for allocations faster than the parent's RSS polling.
+        # Address space already mapped by imports (e.g. numpy's BLAS buffers)
+        # scales with core count, so the cap is added on top of it.
+        limit = _address_space_bytes() + 2 * max_rss_bytes
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    conn.send(("ready", None))
+
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+
+        name, data = job
+        try:
+            text = extract(data, name)
+        except MemoryError:
+            conn.send(("memory", "Parser exceeded the memory limit."))
+            return
+        except Exception as exc:
+            conn.send(("parse_error", str(exc) or type(exc).__name__))
+            continue
+
+        if len(text) > max_chars:
+            conn.send(
+                ("output_limit", f"Extracted text exceeds {max_chars:,} characters.")
+            )
+        else:
+            conn.send(("ok", text))
+
+
+class _Worker:
+    """Parent-side handle for one parser process."""
+
+    def __init__(self, ctx, max_rss_bytes: int, max_chars: int):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, max_rss_bytes, max_chars),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        if not self.conn.poll(_STARTUP_TIMEOUT_S):
+            self.kill()
+            raise ExtractionError("crashed", "Parser process failed to start.")
+        self.conn.recv()
+
+    def rss_bytes(self) -> int | None:
+        """Current resident set size, or None where /proc is unavailable."""
+        try:
+            with open(f"/proc/{self.process.pid}/statm") as fh:
+                return int(fh.read().split()[1]) * _PAGE_SIZE
+        except (OSError, ValueError, IndexError):
+            return None
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Pool
+# ---------------------------------------------------------------------------
+class SandboxPool:
+    """
+    A bounded pool of reusable parser processes.
+
+    Healthy workers go back to the pool after each document, so the cost of
+    isolation on normal files is one pipe round-trip. Workers that time out,
+    exceed the memory cap or die are killed and lazily replaced.
+    """
+
+    def __init__(
+        self,
+        size: int = SANDBOX_POOL_SIZE,
+        timeout: float = SANDBOX_TIMEOUT_S,
+        max_rss_mb: int = SANDBOX_MAX_RSS_MB,
+        max_chars: int = SANDBOX_MAX_TEXT_CHARS,
+    ):
+        self._ctx = worker_context()
+        self.size = size
+        self.timeout = timeout
+        self.max_rss_bytes = max_rss_mb * 1024 * 1024
+        self.max_chars = max_chars
+        self._idle: list[_Worker] = []
+        self._live = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def extract(self, name: str, data: bytes) -> str:
+        """Extract text from one document; raises ``ExtractionError`` on failure."""
+        worker = self._acquire()
+        healthy = False
+        try:
+            text = self._run(worker, name, data)
+            healthy = True
+            return text
+        except ExtractionError as exc:
+            healthy = exc.reason in ("parse_error", "output_limit")
+            raise
+        finally:
+            self._release(worker, healthy)
+
+    def close(self) -> None:
+        """Stop all idle workers; busy ones are stopped when released."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._live -= len(idle)
+            self._cond.notify_all()
+        for worker in idle:
+            worker.kill()
+
+    # -- internals ----------------------------------------------------------
+    def _acquire(self) -> _Worker:
+        with self._cond:
+            while not self._idle and self._live >= self.size:
+                self._cond.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._live += 1
+        try:
+            return _Worker(self._ctx, self.max_rss_bytes, self.max_chars)
+        except BaseException:
+            with self._cond:
+                self._live -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, worker: _Worker, healthy: bool) -> None:
+        with self._cond:
+            keep = healthy and not self._closed
+            if keep:
+                self._idle.append(worker)
+            else:
+                self._live -= 1
+            self._cond.notify()
+        if not keep:
+            worker.kill()
+
+    def _run(self, worker: _Worker, name: str, data: bytes) -> str:
+        try:
+            worker.conn.send((name, data))
+        except OSError:
+            raise ExtractionError("crashed", "Parser process is not responding.")
+
+        deadline = time.monotonic() + self.timeout
+        while not worker.conn.poll(_POLL_INTERVAL_S):
+            if time.monotonic() > deadline:
+                raise ExtractionError(
+                    "timeout", f"Extraction took longer than {self.timeout:g}s."
+                )
+            rss = worker.rss_bytes()
+            if rss is not None and rss > self.max_rss_bytes:
+                raise ExtractionError(
+                    "memory",
+                    f"Parser exceeded the {self.max_rss_bytes // 2**20} MB memory limit.",
+                )
+            if not worker.process.is_alive():
+                break
+
+        try:
+            kind, payload = worker.conn.recv()
+        except EOFError:
+            raise ExtractionError("crashed", "Parser process exited unexpectedly.")
+        if kind == "ok":
+            return payload
+        raise ExtractionError(kind, payload)
+
+
+# ---------------------------------------------------------------------------
+# Module-level convenience
+# ---------------------------------------------------------------------------
+_default_pool: SandboxPool | None = None
+_default_lock = threading.Lock()
+
+
+def get_default_pool() -> SandboxPool:
+    """Process-wide pool shared by every caller (and Streamlit session)."""
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = SandboxPool()
+        return _default_pool
+
+
+def extract_text_sandboxed(uploaded_file, pool: SandboxPool | None = None) -> str:
+    """Sandboxed drop-in for ``extract_text``."""
+    data = uploaded_file.read()
+    return (pool or get_default_pool()).extract(uploaded_file.name, data)
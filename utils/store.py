@@ -0,0 +1,132 @@
+"""
+store — Server-wide LRU store for analysis results with a byte budget.
+
+Sessions keep only an opaque handle per result. The store keeps the small
+structured fields as they are and the full resume text zlib-compressed.
+Only the preview that the UI displays is kept uncompressed. Entries are
+evicted least-recently-used first once either the global budget or the
+owning session's share is exceeded; callers treat a missing handle as
+"re-analyze".
+"""
+
+import pickle
+import threading
+import uuid
+import zlib
+from collections import OrderedDict
+
+from config.settings import STORE_MAX_MB, STORE_SESSION_MAX_MB, STORE_PREVIEW_CHARS
+
+
+class AnalysisStore:
+    """Thread-safe LRU of analysis results keyed by opaque handles."""
+
+    def __init__(
+        self,
+        max_mb: float = STORE_MAX_MB,
+        session_max_mb: float = STORE_SESSION_MAX_MB,
+        preview_chars: int = STORE_PREVIEW_CHARS,
+    ):
+        self.max_bytes = int(max_mb * 2**20)
+        self.session_max_bytes = int(session_max_mb * 2**20)
+        self.preview_chars = preview_chars
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._owner_bytes: dict[str, int] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    # -- public API ---------------------------------------------------------
+    def put(self, result: dict, owner: str = "") -> str:
+        """Store one analysis result and return its handle."""
+        result = dict(result)
+        raw_text = result.pop("raw_text", "")
+        result["text_preview"] = raw_text[: self.preview_chars]
+        result["text_length"] = len(raw_text)
+        text_z = zlib.compress(raw_text.encode("utf-8"), 6)
+        size = (
+            len(pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+            + len(text_z)
+            + len(result["text_preview"])
+        )
+
+        handle = uuid.uuid4().hex
+        with self._lock:
+            self._entries[handle] = {
+                "result": result,
+                "text_z": text_z,
+                "owner": owner,
+                "size": size,
+            }
+            self._bytes += size
+            self._owner_bytes[owner] = self._owner_bytes.get(owner, 0) + size
+            self._enforce(owner, keep=handle)
+        return handle
+
+    def get(self, handle: str) -> dict | None:
+        """Result for ``handle`` (without full text), or None if evicted."""
+        with self._lock:
+            entry = self._entries.get(handle)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(handle)
+            self.hits += 1
+            return entry["result"]
+
+    def full_text(self, handle: str) -> str | None:
+        """Decompress the complete resume text on demand."""
+        with self._lock:
+            entry = self._entries.get(handle)
+        if entry is None:
+            return None
+        return zlib.decompress(entry["text_z"]).decode("utf-8")
+
+    def __contains__(self, handle: str) -> bool:
+        with self._lock:
+            return handle in self._entries
+
+    def discard(self, handle: str) -> None:
+        with self._lock:
+            if handle in self._entries:
+                self._remove(handle)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "sessions": len(self._owner_bytes),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    # -- internals (call with the lock held) --------------------------------
+    def _remove(self, handle: str) -> None:
+        entry = self._entries.pop(handle)
+        self._bytes -= entry["size"]
+        owner = entry["owner"]
+        self._owner_bytes[owner] -= entry["size"]
+        if not self._owner_bytes[owner]:
+            del self._owner_bytes[owner]
+
+    def _enforce(self, owner: str, keep: str) -> None:
+        # The owner's own oldest entries go first when it is over its share;
+        # the entry just stored (``keep``) always survives.
+        if self._owner_bytes.get(owner, 0) > self.session_max_bytes:
+            for handle in [h for h, e in self._entries.items() if e["owner"] == owner]:
+                if self._owner_bytes[owner] <= self.session_max_bytes:
+                    break
+                if handle != keep:
+                    self._remove(handle)
+                    self.evictions += 1
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            oldest = next(iter(self._entries))
+            if oldest == keep:
+                break
+            self._remove(oldest)
+            self.evictions += 1
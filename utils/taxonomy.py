@@ -0,0 +1,18 @@
+"""
+taxonomy — Stable positional index over every skill in the skills database.
+"""
+
+from config.skills_db import SKILLS_DB, DISPLAY_NAME_OVERRIDES
+
+
+def display_name(skill: str) -> str:
+    """Display name for a search term from ``SKILLS_DB``."""
+    return DISPLAY_NAME_OVERRIDES.get(skill, skill.title())
+
+
+# Every distinct display name, in SKILLS_DB order — the column index used by
+# columnar exports, the role matrix and skill vectors.
+SKILL_TAXONOMY: list[str] = list(
+    dict.fromkeys(display_name(s) for skills in SKILLS_DB.values() for s in skills)
+)
+SKILL_INDEX: dict[str, int] = {name: i for i, name in enumerate(SKILL_TAXONOMY)}
@@ -0,0 +1,322 @@
+"""
+workers — Pre-forked pool of warm analysis workers with recycling.
+
+Workers are forked from a forkserver that has already imported
+``utils.preload``. Parsers, compiled skill patterns and the role matrix are
+then built once and shared copy-on-write rather than rebuilt per process.
+Every worker is started when the pool is created, so the first job skips
+startup. A worker is replaced after ``max_jobs`` jobs or once its resident
+memory passes ``max_rss_mb``. The pool keeps per-worker job counts and
+throughput.
+
+``WarmPool.submit`` returns ``concurrent.futures.Future`` objects, so the
+pool can be passed straight to ``utils.batch.iter_batch(executor=...)``.
+"""
+
+import importlib
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+import warnings
+from concurrent.futures import Future
+
+from config.settings import WORKER_POOL_SIZE, WORKER_MAX_JOBS, WORKER_MAX_RSS_MB
+
+PRELOAD_MODULES = ["utils.preload"]
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_STARTUP_TIMEOUT_S = 60.0
+_STOP_TIMEOUT_S = 5.0
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def worker_context():
+    """
+    Start-method context for worker processes.
+
+    ``forkserver`` with ``PRELOAD_MODULES`` preloaded where available, else
+    ``spawn``. The preload applies only if the forkserver has not started
+    yet, so create pools through this before any other forkserver use. The
+    forkserver does not inherit ``sys.path`` and silently skips modules it
+    cannot import, so the repo root is put on ``PYTHONPATH`` first; without
+    it the preload only works when started from the repo root.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        paths = [p for p in os.environ.get("PYTHONPATH", "").split(os.pathsep) if p]
+        if _ROOT not in paths:
+            os.environ["PYTHONPATH"] = os.pathsep.join([_ROOT, *paths])
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(PRELOAD_MODULES)
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+# ---------------------------------------------------------------------------
+# Worker process
+# ---------------------------------------------------------------------------
+def _worker_main(conn) -> None:
+    """Run ``(fn, args, kwargs)`` jobs until the pipe closes or ``None`` arrives."""
+    preloaded = all(name in sys.modules for name in PRELOAD_MODULES)
+    for name in PRELOAD_MODULES:
+        importlib.import_module(name)
+    conn.send(("ready", preloaded))
+
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+
+        fn, args, kwargs = job
+        try:
+            outcome = ("ok", fn(*args, **kwargs))
+        except Exception as exc:
+            outcome = ("error", exc)
+        try:
+            conn.send(outcome)
+        except Exception as exc:  # unpicklable result or exception
+            conn.send(("error", RuntimeError(f"Could not return job result: {exc}")))
+
+
+class _Worker:
+    """Parent-side handle for one warm worker process."""
+
+    def __init__(self, ctx):
+        start = time.perf_counter()
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        if not self.conn.poll(_STARTUP_TIMEOUT_S):
+            self.kill()
+            raise RuntimeError("Worker process failed to start.")
+        _, self.preloaded = self.conn.recv()
+        self.startup_s = time.perf_counter() - start
+        self.jobs = 0
+
+    def rss_bytes(self) -> int | None:
+        """Current resident set size, or None where /proc is unavailable."""
+        try:
+            with open(f"/proc/{self.process.pid}/statm") as fh:
+                return int(fh.read().split()[1]) * _PAGE_SIZE
+        except (OSError, ValueError, IndexError):
+            return None
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(_STOP_TIMEOUT_S)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Pool
+# ---------------------------------------------------------------------------
+class WarmPool:
+    """
+    A fixed number of warm worker processes fed from one job queue.
+
+    Each slot has a dispatcher thread that owns one worker at a time. The
+    thread sends it jobs, waits for results and replaces it when it is due
+    for recycling or has died.
+    """
+
+    def __init__(
+        self,
+        size: int = WORKER_POOL_SIZE,
+        max_jobs: int = WORKER_MAX_JOBS,
+        max_rss_mb: float = WORKER_MAX_RSS_MB,
+        mp_context=None,
+    ):
+        self._ctx = mp_context or worker_context()
+        self.size = size
+        self.max_jobs = max_jobs
+        self.max_rss_bytes = int(max_rss_mb * 2**20)
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._workers: list[_Worker | None] = [None] * size
+        self._stats = [
+            {
+                "jobs": 0,
+                "busy_s": 0.0,
+                "generation": 0,
+                "recycled_jobs": 0,
+                "recycled_rss": 0,
+                "crashed": 0,
+            }
+            for _ in range(size)
+        ]
+        self._threads = [
+            threading.Thread(target=self._serve, args=(slot,), daemon=True)
+            for slot in range(size)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """Queue ``fn(*args, **kwargs)``; ``fn`` must be picklable."""
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot submit to a pool that has been shut down.")
+            self._jobs.put((future, fn, args, kwargs))
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Finish queued jobs, then stop every worker."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for _ in self._threads:
+                self._jobs.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def __enter__(self) -> "WarmPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+    def stats(self) -> list[dict]:
+        """
+        Per-slot counters covering the current worker and its predecessors.
+
+        ``jobs_per_s`` is the slot's throughput while busy. The ``pid``,
+        ``rss_mb``, ``preloaded`` and ``startup_ms`` fields describe the
+        current worker and are None while a slot has none.
+        """
+        with self._lock:
+            snapshot = [(dict(s), w) for s, w in zip(self._stats, self._workers)]
+        rows = []
+        for slot, (stats, worker) in enumerate(snapshot):
+            busy = stats["busy_s"]
+            row = {
+                "slot": slot,
+                **stats,
+                "jobs_per_s": stats["jobs"] / busy if busy else 0.0,
+                "pid": None,
+                "rss_mb": None,
+                "preloaded": None,
+                "startup_ms": None,
+            }
+            if worker is not None:
+                rss = worker.rss_bytes()
+                row.update(
+                    pid=worker.process.pid,
+                    rss_mb=rss / 2**20 if rss is not None else None,
+                    preloaded=worker.preloaded,
+                    startup_ms=worker.startup_s * 1000,
+                )
+            rows.append(row)
+        return rows
+
+    # -- internals ----------------------------------------------------------
+    def _start_worker(self, slot: int) -> _Worker:
+        worker = _Worker(self._ctx)
+        if not worker.preloaded and self._ctx.get_start_method() == "forkserver":
+            warnings.warn(
+                f"Worker {worker.process.pid} did not inherit the preloaded "
+                f"modules {PRELOAD_MODULES}; it runs cold. Start the forkserver "
+                "through worker_context() before any other forkserver use.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        with self._lock:
+            self._workers[slot] = worker
+            self._stats[slot]["generation"] += 1
+        return worker
+
+    def _retire(self, slot: int, worker: _Worker, reason: str) -> None:
+        with self._lock:
+            self._workers[slot] = None
+            self._stats[slot][reason] += 1
+        if reason == "crashed":
+            worker.kill()
+        else:
+            worker.stop()
+
+    def _try_start_worker(self, slot: int) -> _Worker | None:
+        if self._closed:
+            return None
+        try:
+            return self._start_worker(slot)
+        except Exception:
+            return None  # retried when the next job arrives
+
+    def _serve(self, slot: int) -> None:
+        worker = self._try_start_worker(slot)
+
+        while True:
+            item = self._jobs.get()
+            if item is None:
+                break
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            if worker is None:
+                try:
+                    worker = self._start_worker(slot)
+                except Exception as exc:
+                    future.set_exception(exc)
+                    continue
+
+            start = time.perf_counter()
+            try:
+                worker.conn.send((fn, args, kwargs))
+                kind, payload = worker.conn.recv()
+            except (EOFError, OSError):
+                pid = worker.process.pid
+                future.set_exception(
+                    RuntimeError(f"Worker process {pid} died during a job.")
+                )
+                self._retire(slot, worker, "crashed")
+                worker = self._try_start_worker(slot)
+                continue
+            except Exception as exc:
+                # Unpicklable job or result. Pickling fails before anything is
+                # written and recv reads the whole message before unpickling,
+                # so the worker and its pipe are still usable.
+                future.set_exception(exc)
+                continue
+
+            worker.jobs += 1
+            with self._lock:
+                self._stats[slot]["jobs"] += 1
+                self._stats[slot]["busy_s"] += time.perf_counter() - start
+            if kind == "ok":
+                future.set_result(payload)
+            else:
+                future.set_exception(payload)
+
+            # Replace the worker now rather than on the next job
+            if worker.jobs >= self.max_jobs:
+                self._retire(slot, worker, "recycled_jobs")
+                worker = self._try_start_worker(slot)
+            else:
+                rss = worker.rss_bytes()
+                if rss is not None and rss > self.max_rss_bytes:
+                    self._retire(slot, worker, "recycled_rss")
+                    worker = self._try_start_worker(slot)
+
+        if worker is not None:
+            with self._lock:
+                self._workers[slot] = None
+            worker.stop()